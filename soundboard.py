@@ -7,10 +7,13 @@ from tkinter import ttk, filedialog, messagebox
 import sounddevice as sd
 import soundfile as sf
 import numpy as np
-import threading
-import queue
+import functools
+import importlib.util
 import json
 import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional, Dict, List
@@ -22,6 +25,82 @@ try:
 except ImportError:
     HOTKEYS_AVAILABLE = False
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from scipy.signal import resample_poly
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+def _load_mix_kernel():
+    """
+    Import soundboard/_mix_kernel.py on its own.
+
+    A plain package import would run soundboard/__init__.py, which pulls in
+    the full app (librosa, pydub, customtkinter, PyQt6). The kernel module
+    only needs numpy, with Numba optional, so this script stays standalone.
+    It is registered under its package name because Numba's on-disk cache,
+    shared with the full app, re-imports kernels by module name.
+    """
+    name = "soundboard._mix_kernel"
+    if name in sys.modules:
+        # Already imported, e.g. by the package in the same process
+        return sys.modules[name]
+    path = Path(__file__).resolve().parent / "soundboard" / "_mix_kernel.py"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_mix_kernel = _load_mix_kernel()
+INT16_SCALE = _mix_kernel.INT16_SCALE
+mix_block = _mix_kernel.mix_block
+new_voice_list = _mix_kernel.new_voice_list
+
+# Number of pre-allocated voice slots (max simultaneous sounds)
+MAX_VOICES = 32
+SAMPLE_RATE = 48000
+
+# Delay before writing the config, so bursts of edits cause one write
+SAVE_DEBOUNCE_MS = 250
+
+# Modifier names checked when a hotkey's trigger key is pressed
+HOTKEY_MODIFIERS = ("ctrl", "alt", "shift", "windows")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_devices() -> tuple:
+    """Query audio devices once; PortAudio enumeration is slow on Windows."""
+    return tuple(sd.query_devices())
+
+
+def _rescan_portaudio() -> bool:
+    """
+    Reinitialize PortAudio so it picks up added or removed devices.
+
+    PortAudio only rescans devices on initialization, and sounddevice exposes
+    that only through its private _terminate()/_initialize() (present in
+    sounddevice 0.5.x). Returns False without touching PortAudio when they are
+    missing, in which case a re-query only sees devices known at startup.
+    """
+    terminate = getattr(sd, "_terminate", None)
+    initialize = getattr(sd, "_initialize", None)
+    if terminate is None or initialize is None:
+        return False
+    terminate()
+    initialize()
+    return True
+
 
 @dataclass
 class SoundSlot:
@@ -30,31 +109,113 @@ class SoundSlot:
     hotkey: Optional[str] = None
     volume: float = 1.0
 
+    @functools.cached_property
+    def label(self) -> str:
+        """Button text; slots are replaced rather than mutated, so this never goes stale."""
+        return f"{self.name}\n[{self.hotkey}]" if self.hotkey else self.name
+
+
+class SoundCache:
+    """Decoded sounds, resampled once and stored as contiguous stereo int16.
+
+    int16 halves the memory the mix kernel streams through per block; the
+    kernel scales samples back to float while accumulating.
+    """
+
+    def __init__(self, channels: int = 2):
+        self.channels = channels
+        self._cache: Dict[tuple, np.ndarray] = {}
+
+    def get_or_load(self, file_path: str, sample_rate: int) -> np.ndarray:
+        key = (file_path, sample_rate)
+        data = self._cache.get(key)
+        if data is None:
+            data = self._load(file_path, sample_rate)
+            self._cache[key] = data
+        return data
+
+    def _load(self, file_path: str, sample_rate: int) -> np.ndarray:
+        with sf.SoundFile(file_path) as f:
+            sr = f.samplerate
+            # Read straight into the final buffer; int16 when no resampling is needed
+            dtype = np.int16 if sr == sample_rate else np.float32
+            data = f.read(out=np.empty((f.frames, f.channels), dtype=dtype))
+        if data.ndim == 2 and data.shape[1] not in (1, self.channels):
+            # Downmix multichannel files to mono before resampling fewer channels
+            data = data.mean(axis=1).astype(data.dtype)
+        if sr != sample_rate:
+            if SCIPY_AVAILABLE:
+                # Polyphase FIR includes the anti-aliasing lowpass
+                data = resample_poly(data, up=sample_rate, down=sr, axis=0)
+            else:
+                if sr % sample_rate == 0:
+                    data = data[:: sr // sample_rate]
+                else:
+                    new_length = int(len(data) * sample_rate / sr)
+                    # Same nearest-lower indices as linspace, in one int64 array
+                    indices = np.arange(new_length, dtype=np.int64) * (len(data) - 1)
+                    indices //= max(new_length - 1, 1)
+                    data = data[indices]
+        # Every cached sound has exactly self.channels columns, so the mix
+        # kernel never branches on layout
+        if data.ndim == 1:
+            data = data[:, None]
+        if data.shape[1] == 1:
+            data = np.repeat(data, self.channels, axis=1)
+        if data.dtype != np.int16:
+            data = np.round(np.clip(data, -1.0, 1.0) * 32767.0)
+        return np.ascontiguousarray(data, dtype=np.int16)
+
 
 class AudioMixer:
     def __init__(
         self,
         input_device: int,
         output_device: int,
-        sample_rate: int = 48000,
+        sample_rate: int = SAMPLE_RATE,
         block_size: int = 1024,
+        sound_cache: Optional[SoundCache] = None,
     ):
         self.input_device = input_device
         self.output_device = output_device
         self.sample_rate = sample_rate
         self.block_size = block_size
         self.channels = 2
+        self.sound_cache = sound_cache or SoundCache(self.channels)
         self.running = False
         self.stream = None
-        self.sound_queue = queue.Queue()
-        self.currently_playing = []
-        self.lock = threading.Lock()
+        # Fixed voice slots shared with the audio callback without a lock,
+        # stored as parallel arrays for the mix kernel. play_sound() only
+        # writes to inactive slots and sets _voice_active last; the kernel only
+        # clears _voice_active once a voice has finished.
+        self._voice_data = new_voice_list(MAX_VOICES, self.channels, np.int16)
+        self._voice_positions = np.zeros(MAX_VOICES, dtype=np.int64)
+        self._voice_volumes = np.zeros(MAX_VOICES, dtype=np.float32)
+        self._voice_lengths = np.zeros(MAX_VOICES, dtype=np.int64)
+        self._voice_active = np.zeros(MAX_VOICES, dtype=np.uint8)
+        # Work buffer for the mix so the audio callback never allocates
+        self._scratch = np.zeros((block_size, self.channels), dtype=np.float32)
+        # Bumped by stop_all_sounds(). Each voice records the epoch it was
+        # requested in; the audio callback retires voices from older epochs and loads
+        # requested before the stop are dropped. _epoch only changes under
+        # _publish_lock, so a loader's epoch check and its publish happen
+        # entirely before or after a stop, never around it.
+        self._epoch = 0
+        self._callback_epoch = 0
+        self._voice_epochs = np.zeros(MAX_VOICES, dtype=np.int64)
+        self._current_epoch = np.zeros(MAX_VOICES, dtype=bool)
+        # File decoding/resampling runs here, never on the GUI or audio thread.
+        # stop() shuts it down and start() creates a fresh one.
+        self._load_executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(max_workers=2)
+        self._publish_lock = threading.Lock()
         self.mic_volume = 1.0
         self.mic_muted = False
 
     def start(self):
         if self.running:
             return
+        if self._load_executor is None:
+            self._load_executor = ThreadPoolExecutor(max_workers=2)
         self.running = True
         self.stream = sd.Stream(
             device=(self.input_device, self.output_device),
@@ -63,84 +224,86 @@ class AudioMixer:
             channels=(1, self.channels),
             callback=self._audio_callback,
             dtype=np.float32,
+            # mix_block() already clamps to [-1, 1]; skip PortAudio's second pass
+            clip_off=True,
         )
         self.stream.start()
 
     def stop(self):
         self.running = False
+        if self._load_executor is not None:
+            self._load_executor.shutdown(wait=False)
+            self._load_executor = None
         if self.stream:
             self.stream.stop()
             self.stream.close()
             self.stream = None
 
-    def _audio_callback(self, indata, outdata, frames, time, status):
-        if self.mic_muted:
-            mixed = np.zeros((frames, self.channels), dtype=np.float32)
-        else:
-            mic_mono = indata[:, 0] * self.mic_volume
-            mixed = np.column_stack([mic_mono, mic_mono])
-
-        while not self.sound_queue.empty():
-            try:
-                sound_data = self.sound_queue.get_nowait()
-                with self.lock:
-                    self.currently_playing.append(sound_data)
-            except queue.Empty:
-                break
-
-        with self.lock:
-            finished = []
-            for i, sound in enumerate(self.currently_playing):
-                pos = sound["position"]
-                data = sound["data"]
-                volume = sound["volume"]
-                remaining = len(data) - pos
-
-                if remaining <= 0:
-                    finished.append(i)
-                    continue
-
-                chunk_size = min(frames, remaining)
-                chunk = data[pos : pos + chunk_size] * volume
-
-                if chunk.ndim == 1:
-                    chunk = np.column_stack([chunk, chunk])
-                elif chunk.shape[1] == 1:
-                    chunk = np.column_stack([chunk[:, 0], chunk[:, 0]])
-
-                if chunk_size < frames:
-                    padded = np.zeros((frames, self.channels), dtype=np.float32)
-                    padded[:chunk_size] = chunk
-                    chunk = padded
-
-                mixed += chunk
-                sound["position"] += chunk_size
-
-            for i in reversed(finished):
-                self.currently_playing.pop(i)
+    def _retire_stale_voices(self):
+        """Drop voices started before the last stop_all_sounds(). Run by the audio callback."""
+        epoch = self._epoch
+        if epoch != self._callback_epoch:
+            np.equal(self._voice_epochs, epoch, out=self._current_epoch)
+            np.logical_and(self._voice_active, self._current_epoch, out=self._voice_active)
+            self._callback_epoch = epoch
 
-        np.clip(mixed, -1.0, 1.0, out=outdata)
+    def _audio_callback(self, indata, outdata, frames, time, status):
+        self._retire_stale_voices()
+        mix_block(
+            outdata,
+            indata,
+            np.float32(self.mic_volume),
+            bool(self.mic_muted),
+            self._voice_data,
+            self._voice_positions,
+            self._voice_volumes,
+            self._voice_lengths,
+            self._voice_active,
+            frames,
+            INT16_SCALE,
+            self._scratch,
+        )
 
     def play_sound(self, file_path: str, volume: float = 1.0):
+        """Queue a sound for playback. Decoding happens on a loader thread."""
+        executor = self._load_executor
+        if executor is None:
+            # Stopped; start() creates a new loader pool
+            return
+        executor.submit(self._load_and_enqueue, file_path, volume, self._epoch)
+
+    def _load_and_enqueue(self, file_path: str, volume: float, epoch: int):
         try:
-            data, sr = sf.read(file_path, dtype="float32")
-            if sr != self.sample_rate:
-                ratio = self.sample_rate / sr
-                new_length = int(len(data) * ratio)
-                indices = np.linspace(0, len(data) - 1, new_length).astype(int)
-                data = data[indices]
-            self.sound_queue.put({"data": data, "position": 0, "volume": volume})
+            data = self.sound_cache.get_or_load(file_path, self.sample_rate)
+            # Loaders and stop_all_sounds() serialize here; the callback never takes this lock
+            with self._publish_lock:
+                if epoch != self._epoch:
+                    # stop_all_sounds() was called while this sound was loading
+                    return
+                idx = self._claim_voice()
+                if idx is None:
+                    print("Error playing sound: all voices are busy")
+                    return
+                self._voice_data[idx] = data
+                self._voice_lengths[idx] = len(data)
+                self._voice_positions[idx] = 0
+                self._voice_volumes[idx] = volume
+                self._voice_epochs[idx] = epoch
+                # Publish last so the callback never sees a half-written voice
+                self._voice_active[idx] = 1
         except Exception as e:
             print(f"Error loading sound: {e}")
 
+    def _claim_voice(self) -> Optional[int]:
+        """Return the first inactive voice slot, or None if all are playing."""
+        free = np.flatnonzero(self._voice_active == 0)
+        return int(free[0]) if len(free) else None
+
     def stop_all_sounds(self):
-        with self.lock:
-            self.currently_playing.clear()
-        while not self.sound_queue.empty():
-            try:
-                self.sound_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Waits for any loader mid-publish, so its voice carries the old epoch
+        # and is retired by the next block
+        with self._publish_lock:
+            self._epoch += 1
 
 
 class SoundboardApp:
@@ -152,9 +315,22 @@ class SoundboardApp:
         self.root.geometry("800x600")
         self.root.configure(bg="#2C2F33")
         self.mixer = None
+        self.sound_cache = SoundCache()
+        self._preload_executor = ThreadPoolExecutor(max_workers=2)
         self.sound_slots = {}
         self.slot_buttons = {}
-        self.registered_hotkeys = []
+        # Last (text, bg, fg) pushed to each button, so updates only send changes to Tk
+        self._btn_state: Dict[int, tuple] = {}
+        self._save_pending = None
+        self._hotkey_to_slot: Dict[tuple, int] = {}
+        # keyboard.add_hotkey() handles for combos the lookup table can't express
+        self._fallback_hotkeys: List = []
+        # Scan code -> modifier name for modifier keys currently held down
+        self._held_modifiers: Dict[int, str] = {}
+        self._hotkey_hook = None
+        if HOTKEYS_AVAILABLE:
+            # One global hook; _register_hotkeys() only swaps the lookup table
+            self._hotkey_hook = keyboard.hook(self._dispatch_hotkey)
         self._setup_styles()
         self._create_ui()
         self._load_config()
@@ -174,14 +350,6 @@ class SoundboardApp:
         device_frame = ttk.LabelFrame(main_frame, text="Audio Devices", padding=10)
         device_frame.pack(fill=tk.X, pady=(0, 10))
 
-        devices = sd.query_devices()
-        input_devices = [
-            (i, d["name"]) for i, d in enumerate(devices) if d["max_input_channels"] > 0
-        ]
-        output_devices = [
-            (i, d["name"]) for i, d in enumerate(devices) if d["max_output_channels"] > 0
-        ]
-
         ttk.Label(device_frame, text="Microphone (Input):").grid(
             row=0, column=0, sticky="w", padx=5
         )
@@ -189,9 +357,6 @@ class SoundboardApp:
         self.input_combo = ttk.Combobox(
             device_frame, textvariable=self.input_var, width=50, state="readonly"
         )
-        self.input_combo["values"] = [f"{i}: {name}" for i, name in input_devices]
-        if input_devices:
-            self.input_combo.current(0)
         self.input_combo.grid(row=0, column=1, padx=5, pady=2)
 
         ttk.Label(device_frame, text="Virtual Cable (Output):").grid(
@@ -201,16 +366,13 @@ class SoundboardApp:
         self.output_combo = ttk.Combobox(
             device_frame, textvariable=self.output_var, width=50, state="readonly"
         )
-        self.output_combo["values"] = [f"{i}: {name}" for i, name in output_devices]
-        for idx, (i, name) in enumerate(output_devices):
-            if "cable" in name.lower() or "virtual" in name.lower():
-                self.output_combo.current(idx)
-                break
-        else:
-            if output_devices:
-                self.output_combo.current(0)
         self.output_combo.grid(row=1, column=1, padx=5, pady=2)
 
+        ttk.Button(device_frame, text="Refresh", command=self._refresh_devices).grid(
+            row=2, column=1, sticky="e", padx=5, pady=2
+        )
+        self._populate_devices()
+
         self.toggle_btn = tk.Button(
             device_frame,
             text="▶ Start",
@@ -279,6 +441,7 @@ class SoundboardApp:
             btn.grid(row=row, column=col, padx=5, pady=5, sticky="nsew")
             btn.bind("<Button-3>", lambda e, idx=i: self._configure_slot(idx))
             self.slot_buttons[i] = btn
+            self._btn_state[i] = (f"Slot {i+1}\n(Empty)", "#40444B", "#8E9297")
 
         for i in range(4):
             self.grid_frame.columnconfigure(i, weight=1)
@@ -290,6 +453,40 @@ class SoundboardApp:
             fill=tk.X, pady=(10, 0)
         )
 
+    def _populate_devices(self):
+        devices = _get_devices()
+        input_devices = [
+            (i, d["name"]) for i, d in enumerate(devices) if d["max_input_channels"] > 0
+        ]
+        output_devices = [
+            (i, d["name"]) for i, d in enumerate(devices) if d["max_output_channels"] > 0
+        ]
+
+        self.input_combo["values"] = [f"{i}: {name}" for i, name in input_devices]
+        if input_devices:
+            self.input_combo.current(0)
+
+        self.output_combo["values"] = [f"{i}: {name}" for i, name in output_devices]
+        for idx, (i, name) in enumerate(output_devices):
+            if "cable" in name.lower() or "virtual" in name.lower():
+                self.output_combo.current(idx)
+                break
+        else:
+            if output_devices:
+                self.output_combo.current(0)
+
+    def _refresh_devices(self):
+        if self.mixer and self.mixer.running:
+            messagebox.showinfo("Refresh Devices", "Stop the audio stream before refreshing")
+            return
+        rescanned = _rescan_portaudio()
+        _get_devices.cache_clear()
+        self._populate_devices()
+        if rescanned:
+            self.status_var.set("Device list refreshed")
+        else:
+            self.status_var.set("Device list refreshed (restart to detect new devices)")
+
     def _toggle_stream(self):
         if self.mixer and self.mixer.running:
             self.mixer.stop()
@@ -299,7 +496,7 @@ class SoundboardApp:
             try:
                 input_idx = int(self.input_var.get().split(":")[0])
                 output_idx = int(self.output_var.get().split(":")[0])
-                self.mixer = AudioMixer(input_idx, output_idx)
+                self.mixer = AudioMixer(input_idx, output_idx, sound_cache=self.sound_cache)
                 self.mixer.start()
                 self.toggle_btn.configure(text="⏹ Stop", bg="#F04747")
                 self.status_var.set("Running - Mic → Virtual Cable")
@@ -381,6 +578,7 @@ class SoundboardApp:
             self._update_slot_button(slot_idx)
             self._register_hotkeys()
             self._save_config()
+            self._preload_executor.submit(self._preload_sound, path_var.get())
             dialog.destroy()
 
         def clear():
@@ -403,32 +601,82 @@ class SoundboardApp:
         ).pack(side=tk.LEFT, padx=5)
 
     def _update_slot_button(self, slot_idx):
-        btn = self.slot_buttons[slot_idx]
         if slot_idx in self.sound_slots:
-            slot = self.sound_slots[slot_idx]
-            hk = f"\n[{slot.hotkey}]" if slot.hotkey else ""
-            btn.configure(text=f"{slot.name}{hk}", bg="#7289DA", fg="white")
+            state = (self.sound_slots[slot_idx].label, "#7289DA", "white")
         else:
-            btn.configure(text=f"Slot {slot_idx + 1}\n(Empty)", bg="#40444B", fg="#8E9297")
+            state = (f"Slot {slot_idx + 1}\n(Empty)", "#40444B", "#8E9297")
+        previous = self._btn_state.get(slot_idx, (None, None, None))
+        changed = {
+            key: value
+            for key, value, old in zip(("text", "bg", "fg"), state, previous)
+            if value != old
+        }
+        if changed:
+            self.slot_buttons[slot_idx].configure(**changed)
+            self._btn_state[slot_idx] = state
 
     def _register_hotkeys(self):
+        """
+        Rebuild the (modifiers, scan code) -> slot table used by _dispatch_hotkey.
+
+        Hotkeys that are not "modifiers + one key" (modifier-only combos such as
+        ctrl+alt, or multi-step ones such as "ctrl+a, b") are registered with
+        keyboard.add_hotkey() instead, as before the table existed.
+        """
         if not HOTKEYS_AVAILABLE:
             return
-        for hk in self.registered_hotkeys:
-            try:
-                keyboard.remove_hotkey(hk)
-            except:
-                pass
-        self.registered_hotkeys.clear()
+        for handle in self._fallback_hotkeys:
+            keyboard.remove_hotkey(handle)
+        self._fallback_hotkeys = []
+        table: Dict[tuple, int] = {}
         for slot_idx, slot in self.sound_slots.items():
-            if slot.hotkey:
+            if not slot.hotkey:
+                continue
+            parts = [p.strip().lower() for p in slot.hotkey.split("+") if p.strip()]
+            mods = tuple(m for m in HOTKEY_MODIFIERS if m in parts)
+            keys = [p for p in parts if p not in HOTKEY_MODIFIERS]
+            scan_codes = ()
+            if len(keys) == 1 and "," not in slot.hotkey:
                 try:
-                    keyboard.add_hotkey(slot.hotkey, lambda idx=slot_idx: self._play_slot(idx))
-                    self.registered_hotkeys.append(slot.hotkey)
-                except:
+                    scan_codes = keyboard.key_to_scan_codes(keys[0])
+                except ValueError:
                     pass
+            if scan_codes:
+                for scan_code in scan_codes:
+                    table[(mods, scan_code)] = slot_idx
+                continue
+            try:
+                handle = keyboard.add_hotkey(slot.hotkey, lambda idx=slot_idx: self._play_slot(idx))
+            except ValueError as e:
+                print(f"Unsupported hotkey: {e}")
+                continue
+            self._fallback_hotkeys.append(handle)
+        # Swap in one assignment so the hook thread never sees a partial table
+        self._hotkey_to_slot = table
+
+    def _dispatch_hotkey(self, event):
+        """Track held modifiers from the event stream and play the slot bound to a key press."""
+        name = (event.name or "").lower()
+        modifier = next((m for m in HOTKEY_MODIFIERS if m in name), None)
+        if event.event_type == keyboard.KEY_UP:
+            self._held_modifiers.pop(event.scan_code, None)
+            return
+        if modifier is not None:
+            self._held_modifiers[event.scan_code] = modifier
+        held = self._held_modifiers.values()
+        mods = tuple(m for m in HOTKEY_MODIFIERS if m in held)
+        slot_idx = self._hotkey_to_slot.get((mods, event.scan_code))
+        if slot_idx is not None:
+            self._play_slot(slot_idx)
 
     def _save_config(self):
+        """Schedule a config write; repeated calls within the debounce window coalesce."""
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+        self._save_pending = self.root.after(SAVE_DEBOUNCE_MS, self._do_save)
+
+    def _do_save(self):
+        self._save_pending = None
         config = {
             "slots": {
                 str(i): {
@@ -440,15 +688,30 @@ class SoundboardApp:
                 for i, s in self.sound_slots.items()
             }
         }
-        with open(self.CONFIG_FILE, "w") as f:
-            json.dump(config, f)
+        if ORJSON_AVAILABLE:
+            payload = orjson.dumps(config)
+        else:
+            payload = json.dumps(config).encode("utf-8")
+        # Write a temp file and rename so a crash never leaves a half-written config
+        tmp_path = self.CONFIG_FILE + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, self.CONFIG_FILE)
 
     def _load_config(self):
         if not os.path.exists(self.CONFIG_FILE):
             return
         try:
-            with open(self.CONFIG_FILE) as f:
-                config = json.load(f)
+            raw = Path(self.CONFIG_FILE).read_bytes()
+            config = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except (OSError, ValueError) as e:
+            print(f"Error loading config: {e}")
+            return
+        # Let the window paint first; slots fill in on the next idle tick
+        self.root.after_idle(self._apply_config, config)
+
+    def _apply_config(self, config: dict):
+        try:
             for idx, data in config.get("slots", {}).items():
                 self.sound_slots[int(idx)] = SoundSlot(
                     name=data["name"],
@@ -457,13 +720,31 @@ class SoundboardApp:
                     volume=data.get("volume", 1.0),
                 )
                 self._update_slot_button(int(idx))
-            self._register_hotkeys()
-        except:
-            pass
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            print(f"Error loading config: {e}")
+        self._register_hotkeys()
+        self._preload_sounds()
+
+    def _preload_sounds(self):
+        """Warm the sound cache in the background so the first play does no I/O."""
+        for slot in self.sound_slots.values():
+            self._preload_executor.submit(self._preload_sound, slot.file_path)
+
+    def _preload_sound(self, file_path: str):
+        try:
+            self.sound_cache.get_or_load(file_path, SAMPLE_RATE)
+        except Exception as e:
+            print(f"Error preloading sound: {e}")
 
     def _on_close(self):
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+            self._do_save()
+        if self._hotkey_hook is not None:
+            keyboard.unhook(self._hotkey_hook)
         if self.mixer:
             self.mixer.stop()
+        self._preload_executor.shutdown(wait=False)
         self.root.destroy()
 
     def run(self):
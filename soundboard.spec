@@ -83,6 +83,9 @@ a = Analysis(
         'joblib',
         'numba',
         'llvmlite',
+        'soxr',
+        'xxhash',
+        'orjson',
 
         # GUI
         'customtkinter',
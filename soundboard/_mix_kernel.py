@@ -0,0 +1,390 @@
+"""
+Compiled mixing kernels for the Discord Soundboard.
+
+Uses Numba when available so the per-block mix runs as native code without
+holding the GIL. Falls back to an equivalent numpy implementation otherwise.
+"""
+
+import math
+from typing import List
+
+import numpy as np
+
+try:
+    from numba import njit, types
+    from numba.typed import List as TypedList
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Gain that maps int16 PCM to [-1.0, 1.0) float samples
+INT16_SCALE = 1.0 / 32768.0
+
+# Explicit mix_block() signatures: C-contiguous layouts let LLVM vectorize the
+# inner loops without stride checks, and the kernel compiles once at import
+# (or loads from cache) instead of on the first audio callback.
+_MIX_SIGNATURE = (
+    "void(float32[:, ::1], float32[:, ::1], float32, boolean, ListType({voice}[:, ::1]), "
+    "int64[::1], float32[::1], int64[::1], uint8[::1], int64, float32, float32[:, ::1])"
+)
+MIX_SIGNATURES = [_MIX_SIGNATURE.format(voice=dtype) for dtype in ("int16", "float32")]
+
+# quantize_int16() accepts any 2-D float32 layout (views from slicing/downmix)
+QUANTIZE_SIGNATURES = ["int16[:, ::1](float32[:, :], int64)"]
+
+# soft_clip() source and destination may be the same array
+CLIP_SIGNATURES = ["void(float32[:, ::1], float32[:, ::1], float32[:, ::1])"]
+
+# tanh over [0, 8] for the compiled soft_clip(), linearly interpolated: within
+# 3e-7 of tanh (far below 16-bit resolution) and ~8x faster than calling it.
+# Beyond 8, tanh is 1.0 to float32 precision, so lookups clamp to the last entry
+TANH_LUT_STEPS = 512  # entries per unit
+TANH_LUT = np.tanh(np.arange(8 * TANH_LUT_STEPS + 1) / TANH_LUT_STEPS).astype(np.float32)
+
+# scan_voices() fills a preallocated index buffer and returns two counts
+SCAN_SIGNATURES = ["UniTuple(int64, 2)(uint8[::1], int64[::1], int64[::1], int64[::1])"]
+
+# mix_voices() flag bits, one uint8 per voice slot
+VOICE_ACTIVE = 1  # slot holds a sound
+VOICE_PAUSED = 2  # paused by the user
+VOICE_IN_DELAY = 4  # waiting out the delay between loops
+VOICE_HOLD = 8  # skip mixing for one block (cleared by mix_voices)
+
+
+def new_voice_list(
+    count: int, channels: int = 2, dtype=np.float32, readonly: bool = False
+) -> List[np.ndarray]:
+    """
+    Create the per-voice data list passed to mix_block() or mix_voices().
+
+    Every entry starts as an empty (0, channels) buffer of the given dtype so
+    the list stays homogeneous (required for Numba's typed list). Replace
+    entries with C-contiguous (N, channels) arrays of the same dtype (and,
+    with readonly=True, marked read-only) when a voice is started.
+    """
+    empty = np.zeros((0, channels), dtype=dtype)
+    if readonly:
+        empty.setflags(write=False)
+    voices = TypedList() if NUMBA_AVAILABLE else []
+    for _ in range(count):
+        voices.append(empty)
+    return voices
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(MIX_SIGNATURES, cache=True, nogil=True, fastmath=True)
+    def mix_block(
+        out,
+        mic,
+        mic_vol,
+        mic_muted,
+        datas,
+        positions,
+        volumes,
+        lengths,
+        active,
+        frames,
+        scale,
+        scratch,
+    ):
+        """
+        Mix mic input and all active voices into out, clipped to [-1, 1].
+
+        Voice samples are multiplied by volume * scale, so int16 voices can be
+        mixed directly with scale=INT16_SCALE. Advances positions in place and
+        clears active[i] once a voice has played to the end of its data.
+        scratch is a preallocated (frames, channels) float32 work buffer so
+        the numpy fallback does not allocate per block.
+        """
+        channels = out.shape[1]
+        # Interleaved frames are one contiguous run of samples, so each voice
+        # becomes a single multiply-add stream that LLVM vectorizes to FMAs
+        flat_out = out.reshape(-1)
+
+        for f in range(frames):
+            sample = 0.0 if mic_muted else mic[f, 0] * mic_vol
+            for c in range(channels):
+                out[f, c] = sample
+
+        for v in range(active.shape[0]):
+            if not active[v]:
+                continue
+            pos = positions[v]
+            gain = volumes[v] * scale
+            n = min(frames, lengths[v] - pos)
+            chunk = datas[v][pos : pos + n].reshape(-1)
+            for i in range(n * channels):
+                flat_out[i] += chunk[i] * gain
+            positions[v] = pos + n
+            if positions[v] >= lengths[v]:
+                active[v] = 0
+
+        for i in range(frames * channels):
+            flat_out[i] = max(-1.0, min(1.0, flat_out[i]))
+
+    _BUFFER = types.Array(types.float32, 2, "C")
+    VOICE_SIGNATURES = [
+        types.void(
+            _BUFFER,
+            types.ListType(types.Array(dtype, 2, "C", readonly=True)),
+            types.Array(types.int64, 1, "C"),
+            types.Array(types.int64, 1, "C"),
+            types.Array(types.int64, 1, "C"),
+            types.Array(types.float32, 1, "C", readonly=True),
+            types.Array(types.float32, 1, "C"),
+            types.Array(types.uint8, 1, "C"),
+            _BUFFER,
+        )
+        for dtype in (types.int16, types.float32)
+    ]
+    MIC_SIGNATURES = [
+        types.void(_BUFFER, _BUFFER, types.Array(types.float32, 1, "C"), types.float32)
+    ]
+
+    @njit(VOICE_SIGNATURES, cache=True, nogil=True, fastmath=True)
+    def mix_voices(out, datas, positions, lengths, fade_starts, fade, gains, flags, scratch):
+        """
+        Add every playing voice into out and advance its position.
+
+        A voice plays when its flags are exactly VOICE_ACTIVE; VOICE_HOLD is
+        cleared after skipping one block. Each voice adds at most len(out)
+        frames and stops at its length (loop handling is left to the caller).
+        Frames from fade_starts[v] on are also scaled by the fade curve, which
+        must end at the voice's length (fade_starts[v] = length disables it).
+        scratch is a preallocated float32 buffer like out, used by the numpy
+        fallback only.
+        """
+        frames = out.shape[0]
+        channels = out.shape[1]
+        flat_out = out.reshape(-1)
+        for v in range(flags.shape[0]):
+            f = flags[v]
+            if f & VOICE_HOLD:
+                flags[v] = f & ~VOICE_HOLD
+                continue
+            if f != VOICE_ACTIVE:
+                continue
+            pos = positions[v]
+            n = min(frames, lengths[v] - pos)
+            if n <= 0:
+                continue
+            gain = gains[v]
+            data = datas[v]
+            # Frames before the fade are one flat multiply-add stream
+            plain = min(n, max(fade_starts[v] - pos, 0))
+            chunk = data[pos : pos + plain].reshape(-1)
+            for i in range(plain * channels):
+                flat_out[i] += chunk[i] * gain
+            for i in range(plain, n):
+                faded = gain * fade[pos + i - fade_starts[v]]
+                for c in range(channels):
+                    out[i, c] += data[pos + i, c] * faded
+            positions[v] = pos + n
+
+    @njit(SCAN_SIGNATURES, cache=True, nogil=True)
+    def scan_voices(flags, positions, lengths, boundary):
+        """
+        Find voices that need per-voice bookkeeping before the next mix.
+
+        Writes the slots of unpaused voices that are in their loop delay or
+        have played to the end into boundary, and returns (number of those
+        slots, number of unpaused voices). Allocates nothing.
+        """
+        found = 0
+        playing = 0
+        for v in range(flags.shape[0]):
+            f = flags[v]
+            if (f & (VOICE_ACTIVE | VOICE_PAUSED)) != VOICE_ACTIVE:
+                continue
+            playing += 1
+            if f & VOICE_IN_DELAY or positions[v] >= lengths[v]:
+                boundary[found] = v
+                found += 1
+        return found, playing
+
+    @njit(CLIP_SIGNATURES, cache=True, nogil=True, fastmath=True)
+    def soft_clip(src, out, scratch):
+        """
+        Soft-limit src into out: samples within [-1, 1] pass unchanged, larger
+        ones map to sign(x) * (1 + 0.4 * tanh(|x| - 1)), approaching 1.4.
+
+        out may be src itself. scratch is a preallocated float32 buffer like
+        src, used by the numpy fallback only.
+        """
+        # One pass: samples under full scale are copied, the rest are limited
+        flat_src = src.reshape(-1)
+        flat_out = out.reshape(-1)
+        last = TANH_LUT.shape[0] - 1
+        for i in range(flat_src.shape[0]):
+            x = flat_src[i]
+            magnitude = abs(x)
+            if magnitude > 1.0:
+                t = min((magnitude - 1.0) * TANH_LUT_STEPS, last - 0.001)
+                k = int(t)
+                excess = TANH_LUT[k] + (TANH_LUT[k + 1] - TANH_LUT[k]) * (t - k)
+                x = math.copysign(1.0 + 0.4 * excess, x)
+            flat_out[i] = x
+
+    @njit(MIC_SIGNATURES, cache=True, nogil=True, fastmath=True)
+    def add_mic(out, sounds, mic, gain):
+        """Set out = sounds + mic * gain, broadcasting the mono mic to every channel."""
+        channels = out.shape[1]
+        for f in range(out.shape[0]):
+            sample = mic[f] * gain
+            for c in range(channels):
+                out[f, c] = sounds[f, c] + sample
+
+    @njit(QUANTIZE_SIGNATURES, cache=True, nogil=True)
+    def quantize_int16(src, channels):
+        """
+        Convert (N, 1) or (N, channels) float samples to (N, channels) int16 PCM.
+
+        Scales by 32768, rounds half to even and clips in a single pass,
+        duplicating a mono column across every output channel.
+        """
+        frames = src.shape[0]
+        mono = src.shape[1] == 1
+        out = np.empty((frames, channels), dtype=np.int16)
+        for f in range(frames):
+            for c in range(channels):
+                value = np.rint(src[f, 0 if mono else c] * np.float32(32768.0))
+                out[f, c] = np.int16(max(-32768.0, min(32767.0, value)))
+        return out
+
+else:
+
+    def mix_block(
+        out,
+        mic,
+        mic_vol,
+        mic_muted,
+        datas,
+        positions,
+        volumes,
+        lengths,
+        active,
+        frames,
+        scale,
+        scratch,
+    ):
+        """
+        Mix mic input and all active voices into out, clipped to [-1, 1].
+
+        Voice samples are multiplied by volume * scale, so int16 voices can be
+        mixed directly with scale=INT16_SCALE. Advances positions in place and
+        clears active[i] once a voice has played to the end of its data.
+        scratch is a preallocated (frames, channels) float32 work buffer so
+        the numpy fallback does not allocate per block.
+        """
+        if mic_muted:
+            out[:frames].fill(0.0)
+        else:
+            # Broadcast the mono column across every output channel in one pass
+            np.multiply(mic[:frames, :1], mic_vol, out=out[:frames])
+
+        for v in range(active.shape[0]):
+            if not active[v]:
+                continue
+            pos = positions[v]
+            n = min(frames, lengths[v] - pos)
+            chunk = scratch[:n]
+            np.multiply(datas[v][pos : pos + n], volumes[v] * scale, out=chunk)
+            np.add(out[:n], chunk, out=out[:n])
+            positions[v] = pos + n
+            if positions[v] >= lengths[v]:
+                active[v] = 0
+
+        np.clip(out[:frames], -1.0, 1.0, out=out[:frames])
+
+    def mix_voices(out, datas, positions, lengths, fade_starts, fade, gains, flags, scratch):
+        """
+        Add every playing voice into out and advance its position.
+
+        A voice plays when its flags are exactly VOICE_ACTIVE; VOICE_HOLD is
+        cleared after skipping one block. Each voice adds at most len(out)
+        frames and stops at its length (loop handling is left to the caller).
+        Frames from fade_starts[v] on are also scaled by the fade curve, which
+        must end at the voice's length (fade_starts[v] = length disables it).
+        scratch is a preallocated float32 buffer like out, used by the numpy
+        fallback only.
+        """
+        frames = len(out)
+        for v in np.flatnonzero(flags).tolist():
+            f = int(flags[v])
+            if f & VOICE_HOLD:
+                flags[v] = f & ~VOICE_HOLD
+                continue
+            if f != VOICE_ACTIVE:
+                continue
+            pos = int(positions[v])
+            n = min(frames, int(lengths[v]) - pos)
+            if n <= 0:
+                continue
+            chunk = scratch[:n]
+            np.multiply(datas[v][pos : pos + n], gains[v], out=chunk, dtype=np.float32)
+            plain = min(n, max(int(fade_starts[v]) - pos, 0))
+            if plain < n:
+                start = pos + plain - int(fade_starts[v])
+                np.multiply(chunk[plain:], fade[start : start + n - plain, None], out=chunk[plain:])
+            np.add(out[:n], chunk, out=out[:n])
+            positions[v] = pos + n
+
+    def scan_voices(flags, positions, lengths, boundary):
+        """
+        Find voices that need per-voice bookkeeping before the next mix.
+
+        Writes the slots of unpaused voices that are in their loop delay or
+        have played to the end into boundary, and returns (number of those
+        slots, number of unpaused voices). Allocates nothing.
+        """
+        playing = (flags & (VOICE_ACTIVE | VOICE_PAUSED)) == VOICE_ACTIVE
+        at_boundary = playing & (((flags & VOICE_IN_DELAY) != 0) | (positions >= lengths))
+        slots = np.flatnonzero(at_boundary)
+        boundary[: len(slots)] = slots
+        return len(slots), int(np.count_nonzero(playing))
+
+    def soft_clip(src, out, scratch):
+        """
+        Soft-limit src into out: samples within [-1, 1] pass unchanged, larger
+        ones map to sign(x) * (1 + 0.4 * tanh(|x| - 1)), approaching 1.4.
+
+        out may be src itself. scratch is a preallocated float32 buffer like
+        src, used by the numpy fallback only.
+        """
+        # Fast path: |x| is computed once and reused by the limiting path
+        np.abs(src, out=scratch)
+        if scratch.max() <= 1.0:
+            if out is not src:
+                np.copyto(out, src)
+            return
+
+        # Branch-free form: sign(x) * (min(|x|, 1) + 0.4 * tanh(max(|x| - 1, 0)))
+        np.subtract(scratch, 1.0, out=scratch)
+        np.maximum(scratch, 0.0, out=scratch)
+        np.tanh(scratch, out=scratch)
+        np.multiply(scratch, 0.4, out=scratch)
+        np.clip(src, -1.0, 1.0, out=out)
+        np.copysign(scratch, out, out=scratch)
+        np.add(out, scratch, out=out)
+
+    def add_mic(out, sounds, mic, gain):
+        """Set out = sounds + mic * gain, broadcasting the mono mic to every channel."""
+        np.multiply(mic[:, None], gain, out=out)
+        np.add(out, sounds, out=out)
+
+    def quantize_int16(src, channels):
+        """
+        Convert (N, 1) or (N, channels) float samples to (N, channels) int16 PCM.
+
+        Scales by 32768, rounds half to even and clips in a single pass,
+        duplicating a mono column across every output channel.
+        """
+        scaled = np.multiply(src, np.float32(32768.0), dtype=np.float32)
+        np.clip(scaled, -32768.0, 32767.0, out=scaled)
+        np.rint(scaled, out=scaled)
+        out = np.empty((len(src), channels), dtype=np.int16)
+        # Broadcasting duplicates a mono column while casting
+        np.copyto(out, scaled, casting="unsafe")
+        return out
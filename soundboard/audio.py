@@ -11,15 +11,20 @@ os.environ["OPENBLAS_NUM_THREADS"] = "1"
 os.environ["MKL_NUM_THREADS"] = "1"
 os.environ["NUMEXPR_NUM_THREADS"] = "1"
 
+import collections
 import ctypes
+import functools
 import glob
 import hashlib
 import io
 import logging
+import math
 import queue
 import shutil
 import sys
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from fractions import Fraction
 from pathlib import Path
 
 import numpy as np
@@ -27,10 +32,104 @@ import sounddevice as sd
 import soundfile as sf
 from typing import Optional, Dict, List, Tuple
 
+from ._mix_kernel import (
+    INT16_SCALE,
+    VOICE_ACTIVE,
+    VOICE_HOLD,
+    VOICE_IN_DELAY,
+    VOICE_PAUSED,
+    add_mic,
+    mix_voices,
+    new_voice_list,
+    quantize_int16,
+    scan_voices,
+    soft_clip,
+)
 from .constants import AUDIO, SOUNDS_DIR
 
 logger = logging.getLogger(__name__)
 
+# Bind SendInput once with explicit argument types so each call skips the
+# windll attribute lookups and ctypes' argument type guessing. A private WinDLL
+# handle keeps these argtypes from leaking into other libraries' ctypes.windll use.
+try:
+    _user32 = ctypes.WinDLL("user32")  # type: ignore[attr-defined]
+    _SendInput = _user32.SendInput
+    _SendInput.argtypes = [ctypes.c_uint, ctypes.c_void_p, ctypes.c_int]
+    _SendInput.restype = ctypes.c_uint
+except AttributeError:
+    _SendInput = None  # Not on Windows
+
+# Thread priorities for the app's own background threads (PortAudio already
+# runs the stream callbacks at an elevated priority)
+_THREAD_PRIORITY_ABOVE_NORMAL = 1
+try:
+    _kernel32 = ctypes.WinDLL("kernel32")  # type: ignore[attr-defined]
+    _GetCurrentThread = _kernel32.GetCurrentThread
+    _GetCurrentThread.restype = ctypes.c_void_p
+    _SetThreadPriority = _kernel32.SetThreadPriority
+    _SetThreadPriority.argtypes = [ctypes.c_void_p, ctypes.c_int]
+    _SetThreadPriority.restype = ctypes.c_int
+except AttributeError:
+    _SetThreadPriority = None  # Not on Windows
+
+
+def _set_current_thread_priority(priority: int):
+    """Raise the calling thread's scheduling priority. No-op off Windows."""
+    if _SetThreadPriority is None:
+        return
+    if not _SetThreadPriority(_GetCurrentThread(), priority):
+        logger.debug("SetThreadPriority(%d) failed", priority)
+
+
+# SendInput structures and flags, defined once instead of on every input event
+_INPUT_MOUSE = 0
+_INPUT_KEYBOARD = 1
+_KEYEVENTF_KEYUP = 0x0002
+_XBUTTON1 = 0x0001
+_XBUTTON2 = 0x0002
+
+# Button name -> (down flag, up flag, mouseData)
+_MOUSE_BUTTON_FLAGS: Dict[str, Tuple[int, int, int]] = {
+    "left": (0x0002, 0x0004, 0),  # MOUSEEVENTF_LEFTDOWN / LEFTUP
+    "right": (0x0008, 0x0010, 0),  # MOUSEEVENTF_RIGHTDOWN / RIGHTUP
+    "middle": (0x0020, 0x0040, 0),  # MOUSEEVENTF_MIDDLEDOWN / MIDDLEUP
+    "x": (0x0080, 0x0100, _XBUTTON1),  # MOUSEEVENTF_XDOWN / XUP
+    "x1": (0x0080, 0x0100, _XBUTTON1),
+    "x2": (0x0080, 0x0100, _XBUTTON2),
+}
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", ctypes.c_long),
+        ("dy", ctypes.c_long),
+        ("mouseData", ctypes.c_ulong),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", ctypes.c_ushort),
+        ("wScan", ctypes.c_ushort),
+        ("dwFlags", ctypes.c_ulong),
+        ("time", ctypes.c_ulong),
+        ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", _MOUSEINPUT), ("ki", _KEYBDINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    # Matches the Win32 INPUT layout, so sizeof() is what SendInput expects
+    _anonymous_ = ("u",)
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
 
 # Mouse button simulation using direct Windows SendInput API
 # Avoids the mouse library which can have internal state tracking issues
@@ -41,105 +140,86 @@ def _simulate_mouse_button(button: str, press: bool = True):
     This is more reliable than the mouse library because it doesn't maintain
     internal state that can get confused by concurrent physical button presses.
     """
-    # Mouse event flags for SendInput
-    MOUSEEVENTF_LEFTDOWN = 0x0002
-    MOUSEEVENTF_LEFTUP = 0x0004
-    MOUSEEVENTF_RIGHTDOWN = 0x0008
-    MOUSEEVENTF_RIGHTUP = 0x0010
-    MOUSEEVENTF_MIDDLEDOWN = 0x0020
-    MOUSEEVENTF_MIDDLEUP = 0x0040
-    MOUSEEVENTF_XDOWN = 0x0080
-    MOUSEEVENTF_XUP = 0x0100
-    XBUTTON1 = 0x0001
-    XBUTTON2 = 0x0002
-    INPUT_MOUSE = 0
-
-    class MOUSEINPUT(ctypes.Structure):
-        _fields_ = [
-            ("dx", ctypes.c_long),
-            ("dy", ctypes.c_long),
-            ("mouseData", ctypes.c_ulong),
-            ("dwFlags", ctypes.c_ulong),
-            ("time", ctypes.c_ulong),
-            ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
-        ]
-
-    class INPUT(ctypes.Structure):
-        _fields_ = [
-            ("type", ctypes.c_ulong),
-            ("mi", MOUSEINPUT),
-            ("padding", ctypes.c_ubyte * 8),
-        ]
-
-    # Map button names to (down_flag, up_flag, mouseData)
-    button_map = {
-        "left": (MOUSEEVENTF_LEFTDOWN, MOUSEEVENTF_LEFTUP, 0),
-        "right": (MOUSEEVENTF_RIGHTDOWN, MOUSEEVENTF_RIGHTUP, 0),
-        "middle": (MOUSEEVENTF_MIDDLEDOWN, MOUSEEVENTF_MIDDLEUP, 0),
-        "x": (MOUSEEVENTF_XDOWN, MOUSEEVENTF_XUP, XBUTTON1),
-        "x1": (MOUSEEVENTF_XDOWN, MOUSEEVENTF_XUP, XBUTTON1),
-        "x2": (MOUSEEVENTF_XDOWN, MOUSEEVENTF_XUP, XBUTTON2),
-    }
-
-    entry = button_map.get(button)
+    entry = _MOUSE_BUTTON_FLAGS.get(button)
     if entry is None:
         return
 
     down_flag, up_flag, mouse_data = entry
-    flags = down_flag if press else up_flag
 
-    inp = INPUT()
-    inp.type = INPUT_MOUSE
-    inp.mi.dx = 0
-    inp.mi.dy = 0
+    inp = _INPUT()
+    inp.type = _INPUT_MOUSE
     inp.mi.mouseData = mouse_data
-    inp.mi.dwFlags = flags
-    inp.mi.time = 0
-    inp.mi.dwExtraInfo = None
+    inp.mi.dwFlags = down_flag if press else up_flag
+    # dx, dy, time and dwExtraInfo stay zero/NULL from ctypes initialization
 
-    ctypes.windll.user32.SendInput(1, ctypes.byref(inp), ctypes.sizeof(inp))
+    _SendInput(1, ctypes.byref(inp), ctypes.sizeof(_INPUT))
 
 
-def _get_vk_code(key: str) -> Optional[int]:
-    """
-    Get virtual key code for a key using Windows API.
-    Uses VkKeyScanA for characters and MapVirtualKeyA for special keys.
-    Falls back to keyboard library's built-in mapping if available.
-    """
-    key_lower = key.lower().strip()
+# Key name -> virtual key code, built on first use by _build_vk_table()
+_VK_TABLE: Dict[str, int] = {}
 
-    # For single printable characters, use Windows API VkKeyScanA
-    if len(key_lower) == 1:
-        result = ctypes.windll.user32.VkKeyScanA(ord(key_lower))
-        if result != -1:
-            return result & 0xFF  # Low byte is the VK code
 
-    # For special keys, use the keyboard library's internal mapping (read-only, no hooks)
+def _build_vk_table() -> Dict[str, int]:
+    """
+    Build the key name -> VK code table in one pass.
+
+    Named keys come from the keyboard library's internal tables (read-only, no
+    hooks); printable characters come from VkKeyScanA and take precedence.
+    """
+    table: Dict[str, int] = {}
     try:
         import keyboard
 
-        # keyboard.key_to_scan_codes returns scan codes, but we need VK codes
-        # Use keyboard's internal name_to_key mapping
         if hasattr(keyboard, "_winkeyboard"):
-            # keyboard library stores VK codes internally
             from keyboard import _winkeyboard  # type: ignore[attr-defined]
 
-            # Try to find the key in keyboard's internal tables
             # Note: some "names" may contain non-strings (bools), so filter them
-            try:
-                for vk, names in getattr(_winkeyboard, "official_virtual_keys", {}).items():
-                    str_names = [n.lower() for n in names if isinstance(n, str)]
-                    if key_lower in str_names:
-                        return vk
-            except Exception:
-                pass  # Fall through to alternative method
+            for vk, names in getattr(_winkeyboard, "official_virtual_keys", {}).items():
+                for name in names:
+                    if isinstance(name, str):
+                        table.setdefault(name.lower(), vk)
+    except Exception:
+        pass  # Printable characters below still work
+
+    try:
+        vk_key_scan = ctypes.windll.user32.VkKeyScanA
+        for code in range(32, 127):
+            char = chr(code)
+            if char != char.lower():
+                continue
+            result = vk_key_scan(code)
+            if result != -1:
+                table[char] = result & 0xFF  # Low byte is the VK code
+    except Exception:
+        pass  # Not on Windows
+
+    return table
+
+
+def _get_vk_code(key: str) -> Optional[int]:
+    """
+    Get virtual key code for a key using a table built once from the Windows API
+    (VkKeyScanA) and the keyboard library's built-in mapping.
+    Names missing from the table fall back to a scan code lookup via MapVirtualKeyA.
+    """
+    key_lower = key.lower().strip()
+
+    if not _VK_TABLE:
+        _VK_TABLE.update(_build_vk_table())
+    vk = _VK_TABLE.get(key_lower)
+    if vk is not None:
+        return vk
+
+    # Alternative: use key_to_scan_codes and convert (result is remembered)
+    try:
+        import keyboard
 
-        # Alternative: use key_to_scan_codes and convert
         scan_codes = keyboard.key_to_scan_codes(key_lower)
         if scan_codes:
             # Convert scan code to VK using Windows API
             vk = ctypes.windll.user32.MapVirtualKeyA(scan_codes[0], 1)  # MAPVK_VSC_TO_VK
             if vk:
+                _VK_TABLE[key_lower] = vk
                 return vk
     except Exception:
         pass
@@ -153,9 +233,6 @@ def _simulate_key(key: str, press: bool = True):
     Uses dynamic VK code lookup - no hardcoded key mappings.
     Does NOT use the keyboard library for sending - avoids hook conflicts.
     """
-    KEYEVENTF_KEYUP = 0x0002
-    INPUT_KEYBOARD = 1
-
     # Get virtual key code dynamically
     vk = _get_vk_code(key)
 
@@ -171,37 +248,24 @@ def _simulate_key_vk(vk: int, press: bool = True):
     Simulate keyboard key press/release using Windows API (SendInput).
     Takes a VK code directly - NO keyboard library calls, just pure Windows API.
     """
-    KEYEVENTF_KEYUP = 0x0002
-    INPUT_KEYBOARD = 1
-
-    # Define INPUT structure for SendInput
-    class KEYBDINPUT(ctypes.Structure):
-        _fields_ = [
-            ("wVk", ctypes.c_ushort),
-            ("wScan", ctypes.c_ushort),
-            ("dwFlags", ctypes.c_ulong),
-            ("time", ctypes.c_ulong),
-            ("dwExtraInfo", ctypes.POINTER(ctypes.c_ulong)),
-        ]
-
-    class INPUT(ctypes.Structure):
-        _fields_ = [
-            ("type", ctypes.c_ulong),
-            ("ki", KEYBDINPUT),
-            ("padding", ctypes.c_ubyte * 8),
-        ]
-
-    flags = KEYEVENTF_KEYUP if not press else 0
-
-    inp = INPUT()
-    inp.type = INPUT_KEYBOARD
-    inp.ki.wVk = vk
-    inp.ki.wScan = 0
-    inp.ki.dwFlags = flags
-    inp.ki.time = 0
-    inp.ki.dwExtraInfo = None
-
-    ctypes.windll.user32.SendInput(1, ctypes.byref(inp), ctypes.sizeof(inp))
+    _simulate_key_vk_batch([(vk, press)])
+
+
+def _simulate_key_vk_batch(events: List[Tuple[int, bool]]):
+    """
+    Send several (vk, press) keyboard events with a single SendInput call.
+
+    SendInput takes an array, so press/release pairs or multi-key combos cost
+    one user/kernel transition instead of one per event.
+    """
+    inputs = (_INPUT * len(events))()
+    for inp, (vk, press) in zip(inputs, events):
+        inp.type = _INPUT_KEYBOARD
+        inp.ki.wVk = vk
+        inp.ki.dwFlags = 0 if press else _KEYEVENTF_KEYUP
+        # wScan, time and dwExtraInfo stay zero/NULL from ctypes initialization
+
+    _SendInput(len(events), inputs, ctypes.sizeof(_INPUT))
 
 
 # Try to get ffmpeg path from imageio-ffmpeg (bundled ffmpeg)
@@ -244,15 +308,106 @@ try:
 except ImportError:
     LIBROSA_AVAILABLE = False
 
-# Lock to serialize librosa operations (prevents CPU saturation from concurrent calls)
-_librosa_lock = threading.Lock()
+# Caps concurrent librosa time-stretches at half the cores. FFTs run single
+# threaded (see the thread limits above), so sounds triggered together stretch
+# in parallel while the audio and UI threads keep the remaining cores
+_librosa_slots = threading.BoundedSemaphore(max(1, (os.cpu_count() or 2) // 2))
+
+# Import xxhash for fast (non-cryptographic) file hashing when naming sounds
+try:
+    import xxhash
+
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Import soxr for resampling (fastest high-quality resampler; also a librosa dependency)
+try:
+    import soxr
+
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+
+# Import scipy for polyphase resampling (anti-aliased, compiled upfirdn)
+try:
+    from scipy.signal import firwin, resample_poly
+
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+
+# Containers libsndfile cannot read, used when the header is not recognized
+_PYDUB_EXTENSIONS = {".m4a", ".mp4", ".aac", ".wma", ".webm", ".mka"}
+
+
+def _detect_format(head: bytes) -> Optional[str]:
+    """
+    Pick a decoder from a file's first 12 bytes.
+
+    Returns "soundfile" for formats libsndfile can read (WAV, FLAC, AIFF, and
+    OGG/MP3 on recent versions), "pydub" for containers it cannot, or None if
+    the header is not recognized.
+    """
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "soundfile"
+    if head[:4] == b"fLaC" or (head[:4] == b"FORM" and head[8:12] in (b"AIFF", b"AIFC")):
+        return "soundfile"
+    if head[:4] == b"OggS" or head[:3] == b"ID3":
+        return "soundfile"
+    if len(head) >= 2 and head[0] == 0xFF and (head[1] & 0xF6) in (0xF2, 0xF4, 0xF6):
+        return "soundfile"  # MPEG audio frame sync (MP3 without ID3 tag)
+    if head[4:8] == b"ftyp":
+        return "pydub"  # MP4 / M4A / AAC in MP4
+    if head[:4] == b"\x30\x26\xb2\x75":
+        return "pydub"  # ASF (WMA)
+    if head[:4] == b"\x1a\x45\xdf\xa3":
+        return "pydub"  # Matroska / WebM
+    if len(head) >= 2 and head[0] == 0xFF and (head[1] & 0xF6) == 0xF0:
+        return "pydub"  # Raw AAC (ADTS)
+    return None
+
+
+def _choose_decoder(head: bytes, ext: str) -> str:
+    """Pick "soundfile" or "pydub" from the magic bytes, or the lowercase extension if unknown."""
+    decoder = _detect_format(head)
+    if decoder is None:
+        decoder = "pydub" if ext in _PYDUB_EXTENSIONS else "soundfile"
+    return decoder
+
+
+_PCM_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+
+def _pcm_to_float(raw: bytes, sample_width: int) -> np.ndarray:
+    """
+    Convert signed little-endian PCM bytes to float32 samples in [-1.0, 1.0).
+
+    The bytes are viewed in place with np.frombuffer, so the only full pass is
+    the scaled float32 conversion.
+    """
+    if sample_width == 3:
+        # No 24-bit dtype: place each 3-byte sample in the top bytes of an int32
+        packed = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
+        widened = np.zeros((len(packed), 4), dtype=np.uint8)
+        widened[:, 1:] = packed
+        ints = widened.view("<i4").reshape(-1)
+        scale = 1.0 / 2**31
+    else:
+        ints = np.frombuffer(raw, dtype=np.dtype(_PCM_DTYPES[sample_width]).newbyteorder("<"))
+        scale = 1.0 / 2 ** (sample_width * 8 - 1)
+    return np.multiply(ints, np.float32(scale), dtype=np.float32)
 
 
-def read_audio_file(file_path: str) -> Tuple[np.ndarray, int]:
+def read_audio_file(file_path: str, prefer_int16: bool = False) -> Tuple[np.ndarray, int]:
     """
     Read an audio file, using pydub as fallback for formats
     that soundfile doesn't support well (OGG, M4A, AAC, WMA, etc.).
 
+    With prefer_int16=True, 16-bit PCM sources are returned as their raw int16
+    samples (no float conversion); everything else is float32 either way.
+
     Returns:
         Tuple of (audio_data as numpy array, sample_rate)
 
@@ -261,23 +416,21 @@ def read_audio_file(file_path: str) -> Tuple[np.ndarray, int]:
     """
     ext = Path(file_path).suffix.lower()
 
-    # Formats that soundfile usually handles well (but may fail on some OGG files)
-    soundfile_formats = {".wav", ".flac", ".aiff", ".aif"}
+    # Pick the decoder from the file's magic bytes (handles mis-named files);
+    # fall back to the extension when the header is not recognized
+    with open(file_path, "rb") as f:
+        head = f.read(12)
+    decoder = _choose_decoder(head, ext)
 
-    # Try soundfile first for known reliable formats
-    if ext in soundfile_formats:
+    # One soundfile attempt, skipped for containers it cannot read
+    if decoder == "soundfile":
         try:
-            data, sr = sf.read(file_path, dtype="float32")
-            return data, sr
+            with sf.SoundFile(file_path) as f:
+                # Only lossless for 16-bit PCM; float or 24-bit sources stay float
+                dtype = "int16" if prefer_int16 and f.subtype == "PCM_16" else "float32"
+                return f.read(dtype=dtype), f.samplerate
         except Exception:
-            pass  # Fall through to pydub fallback
-
-    # Try soundfile for other formats (might work for some MP3s)
-    try:
-        data, sr = sf.read(file_path, dtype="float32")
-        return data, sr
-    except Exception:
-        pass  # Fall through to pydub fallback
+            pass  # Fall through to pydub fallback (e.g. OGG/MP3 on older libsndfile)
 
     # Fallback to pydub for OGG, M4A, AAC, WMA, WebM, etc.
     if PYDUB_AVAILABLE:
@@ -288,16 +441,15 @@ def read_audio_file(file_path: str) -> Tuple[np.ndarray, int]:
             channels = audio.channels
             sr = audio.frame_rate
 
-            # Get raw samples as numpy array
-            samples = np.array(audio.get_array_of_samples(), dtype=np.float32)
-
-            # Normalize to [-1.0, 1.0] range
-            max_val = float(2 ** (audio.sample_width * 8 - 1))
-            samples = samples / max_val
+            if prefer_int16 and audio.sample_width == 2:
+                samples = np.frombuffer(audio.raw_data, dtype=np.int16)
+            else:
+                # View the raw PCM bytes and normalize to [-1.0, 1.0] in one pass
+                samples = _pcm_to_float(audio.raw_data, audio.sample_width)
 
-            # Reshape for stereo
-            if channels == 2:
-                samples = samples.reshape((-1, 2))
+            # Reshape interleaved multichannel audio to (frames, channels)
+            if channels > 1:
+                samples = samples.reshape((-1, channels))
 
             return samples, sr
         except Exception as e:
@@ -311,11 +463,29 @@ def read_audio_file(file_path: str) -> Tuple[np.ndarray, int]:
         )
 
 
+@functools.lru_cache(maxsize=16)
+def _get_poly_filter(up: int, down: int) -> np.ndarray:
+    """
+    Anti-aliasing FIR for resample_poly, designed once per (up, down) pair.
+
+    Same design resample_poly uses by default (Kaiser, beta 5), so passing it
+    explicitly only skips re-running firwin on every call.
+    """
+    max_rate = max(up, down)
+    taps = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    taps = taps.astype(np.float32)
+    taps.setflags(write=False)
+    return taps
+
+
 def _resample_audio(data: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
     """
-    Resample audio using numpy linear interpolation (fastest, no external dependencies).
+    Resample audio with soxr, a polyphase FIR filter (scipy) when soxr is not
+    installed, or linear interpolation when neither is.
 
-    Quality is lower than FFT-based methods but guaranteed fast (~5ms for typical audio).
+    soxr and the polyphase path band-limit the signal, so downsampling and
+    speed changes do not alias; soxr resamples all channels in one native
+    call and is several times faster. The last fallback is fast but lower quality.
 
     Args:
         data: Audio data as numpy array (mono or stereo)
@@ -328,42 +498,123 @@ def _resample_audio(data: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarra
     if orig_sr == target_sr:
         return data
 
+    if SOXR_AVAILABLE:
+        # Takes (frames, channels) directly; float32 in gives float32 out
+        samples = np.ascontiguousarray(data, dtype=np.float32)
+        return soxr.resample(samples, orig_sr, target_sr, quality="HQ")
+
+    if SCIPY_AVAILABLE:
+        g = math.gcd(orig_sr, target_sr)
+        up = target_sr // g
+        down = orig_sr // g
+        result = resample_poly(data, up, down, axis=0, window=_get_poly_filter(up, down))
+        return result.astype(np.float32, copy=False)
+
     # Pure numpy linear interpolation - guaranteed fast, no parallelization issues
     ratio = target_sr / orig_sr
     new_length = int(len(data) * ratio)
-    old_indices = np.arange(len(data))
     new_indices = np.linspace(0, len(data) - 1, new_length)
 
+    # All channels share the same positions, so compute the integer indices and
+    # fractional weights once and lerp every channel with broadcasting. The two
+    # gathers are the only full-size arrays; the lerp runs in place in float32
+    data = np.asarray(data, dtype=np.float32)
+    idx = new_indices.astype(np.int64)
+    frac = (new_indices - idx).astype(np.float32)
+    if data.ndim == 2:
+        frac = frac[:, None]
+    idx1 = np.minimum(idx + 1, len(data) - 1)
+    result = data[idx]
+    step = data[idx1]
+    np.subtract(step, result, out=step)
+    np.multiply(step, frac, out=step)
+    np.add(result, step, out=result)
+    return result
+
+
+# Fade applied to the end of non-looping sounds while mixing (prevents clicks)
+_FADE_OUT_MS = 30
+
+
+@functools.lru_cache(maxsize=16)
+def _get_fade_curve(fade_samples: int) -> np.ndarray:
+    """Linear 1 -> 0 ramp, built once per length and shared (read-only)."""
+    curve = np.linspace(1.0, 0.0, fade_samples).astype(np.float32)
+    curve.setflags(write=False)
+    return curve
+
+
+def _to_channels(data: np.ndarray, channels: int) -> np.ndarray:
+    """
+    Return audio as a C-contiguous (N, channels) float32 array.
+
+    Mono is duplicated across channels and other layouts are downmixed to mono
+    first, so the output callback can mix any cached sound by plain slicing.
+    """
     if data.ndim == 1:
-        return np.interp(new_indices, old_indices, data).astype(np.float32)
-    else:
-        result = np.zeros((new_length, data.shape[1]), dtype=np.float32)
-        for ch in range(data.shape[1]):
-            result[:, ch] = np.interp(new_indices, old_indices, data[:, ch])
-        return result
+        data = data[:, None]
+    elif data.shape[1] not in (1, channels):
+        data = data.mean(axis=1, keepdims=True)
+    if data.shape[1] == 1 and channels != 1:
+        data = np.repeat(data, channels, axis=1)
+    return np.ascontiguousarray(data, dtype=np.float32)
 
 
-def _apply_fade_out(data: np.ndarray, sample_rate: int, fade_ms: int = 30) -> np.ndarray:
+class RingBuffer:
     """
-    Apply a short fade-out to the end of audio IN-PLACE.
+    Fixed-size single-producer/single-consumer ring of audio blocks.
 
-    Caller must ensure data is already a copy if the original must be preserved
-    (e.g. get_sound_data() already returns copies, and _apply_speed creates new arrays).
+    Lock-free: the producer only advances _head and the consumer only advances
+    _tail (plain int stores are atomic under the GIL), and block storage is
+    allocated once. When the producer gets a full lap ahead, the consumer skips
+    to the newest blocks, so the oldest audio is dropped instead of letting
+    latency build up.
     """
-    fade_samples = int(sample_rate * fade_ms / 1000)
 
-    if fade_samples <= 0 or len(data) < fade_samples:
-        return data
+    def __init__(self, capacity: int, block_size: int, channels: int, dtype=np.float32):
+        self._capacity = capacity
+        self._blocks = np.zeros((capacity, block_size, channels), dtype=dtype)
+        self._lengths = np.zeros(capacity, dtype=np.int64)
+        self._head = 0  # blocks written (producer only)
+        self._tail = 0  # blocks read (consumer only)
 
-    fade_curve = np.linspace(1.0, 0.0, fade_samples).astype(np.float32)
+    def write(self, block: np.ndarray):
+        """Copy a (frames, channels) block into the ring, cast to the ring's dtype.
 
-    if data.ndim == 1:
-        data[-fade_samples:] *= fade_curve
-    else:
-        for ch in range(data.shape[1]):
-            data[-fade_samples:, ch] *= fade_curve
+        Producer thread only.
+        """
+        slot = self._head % self._capacity
+        n = min(len(block), self._blocks.shape[1])
+        self._blocks[slot, :n] = block[:n]
+        self._lengths[slot] = n
+        self._head += 1
 
-    return data
+    def read_into(self, out: np.ndarray) -> int:
+        """Copy the oldest unread block into out and return its frame count (0 if empty).
+
+        Consumer thread only.
+        """
+        head = self._head
+        tail = self._tail
+        if tail == head:
+            return 0
+        if head - tail >= self._capacity:
+            # Overrun: the slot at head % capacity is the next one the producer
+            # overwrites, so resume at the oldest block it won't touch
+            tail = head - self._capacity + 1
+        slot = tail % self._capacity
+        n = min(int(self._lengths[slot]), len(out))
+        out[:n] = self._blocks[slot, :n]
+        self._tail = tail + 1
+        return n
+
+    def clear(self):
+        """Discard unread blocks. Consumer side."""
+        self._tail = self._head
+
+    def pending(self) -> int:
+        """Number of blocks written but not yet read."""
+        return min(self._head - self._tail, self._capacity)
 
 
 class SoundCache:
@@ -373,13 +624,34 @@ class SoundCache:
     - Copies sounds to a local folder for persistence
     - Pre-loads audio data into memory at the target sample rate
     - Provides O(1) lookup for cached audio
+    - Stores audio as int16 by default (half the memory and mix bandwidth of
+      float32); pass store_int16=False to keep full float32 fidelity
+    - Keeps speed-adjusted copies in a size-bounded LRU cache, so replaying a
+      sound at the same speed skips the time-stretch
     """
 
-    def __init__(self, sample_rate: Optional[int] = None):
+    def __init__(
+        self,
+        sample_rate: Optional[int] = None,
+        store_int16: bool = True,
+        max_processed_bytes: int = 128 * 1024 * 1024,
+    ):
         self.sample_rate = sample_rate or AUDIO["sample_rate"]
+        self.channels = AUDIO["channels"]
+        self.store_int16 = store_int16
         self.sounds_dir = Path(SOUNDS_DIR)
         self._cache: Dict[str, np.ndarray] = {}  # filepath -> resampled audio data
+        # (filepath, speed, preserve_pitch) -> speed-adjusted audio, oldest first
+        self._processed: "collections.OrderedDict[Tuple[str, float, bool], np.ndarray]" = (
+            collections.OrderedDict()
+        )
+        self._processed_bytes = 0
+        self.max_processed_bytes = max_processed_bytes
+        # Serializes writers only; readers use single dict.get() calls without it
         self._lock = threading.Lock()
+        # filepath -> set once an in-flight load finishes, so concurrent
+        # requests for the same sound wait for it instead of decoding again
+        self._loading: Dict[str, threading.Event] = {}
 
         # Ensure sounds directory exists
         self.sounds_dir.mkdir(exist_ok=True)
@@ -432,113 +704,251 @@ class SoundCache:
 
         # Cache the audio data directly (already at correct sample rate)
         with self._lock:
-            self._cache[str(dest_path)] = audio_data.copy()
+            self._cache[str(dest_path)] = self._to_stored(audio_data)
 
         return str(dest_path)
 
     def _hash_file(self, file_path: str) -> str:
         """Generate a short hash for a file to create unique names."""
-        hasher = hashlib.md5()
+        # Only used to disambiguate names, so a fast non-cryptographic hash is enough
+        hasher = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.md5()
         with open(file_path, "rb") as f:
-            # Read in chunks for large files
-            for chunk in iter(lambda: f.read(8192), b""):
+            # Read in 1 MiB chunks so per-update() overhead is negligible
+            for chunk in iter(lambda: f.read(1 << 20), b""):
                 hasher.update(chunk)
         return hasher.hexdigest()
 
     def _load_into_cache(self, file_path: str) -> np.ndarray:
-        """Load and resample audio file, caching the result."""
+        """Load and resample audio file, caching the result. Raises if it cannot be loaded."""
+        cached_data = self._cache.get(file_path)
+        if cached_data is not None:
+            return cached_data
+
         with self._lock:
-            if file_path in self._cache:
-                return self._cache[file_path]
+            cached_data = self._cache.get(file_path)
+            if cached_data is not None:
+                return cached_data
+            loading = self._loading.get(file_path)
+            if loading is None:
+                done = self._loading[file_path] = threading.Event()
+        if loading is not None:
+            loading.wait()
+            # Retry: returns the loaded data, or (if that load failed) loads again
+            return self._load_into_cache(file_path)
 
         try:
-            data, sr = self._read_audio_file(file_path)
+            # 16-bit sources go straight into int16 storage without a float pass
+            data, sr = self._read_audio_file(file_path, prefer_int16=self.store_int16)
 
-            # Resample if needed (do this once, not on every play)
+            # Resample if needed (do this once, not on every play). Rebinding
+            # drops each intermediate as soon as the next step has its output
             if sr != self.sample_rate:
+                if data.dtype == np.int16:
+                    data = np.multiply(data, np.float32(INT16_SCALE), dtype=np.float32)
                 data = _resample_audio(data, sr, self.sample_rate)
 
+            data = self._to_stored(data)
+
             with self._lock:
                 self._cache[file_path] = data
-
             return data
-        except Exception as e:
-            print(f"Error loading sound into cache: {e}")
-            raise
+        finally:
+            with self._lock:
+                del self._loading[file_path]
+            done.set()
+
+    def _to_stored(self, data: np.ndarray) -> np.ndarray:
+        """Convert float or int16 audio to the storage format (always a new, read-only array)."""
+        frames = len(data)
+        # int16 PCM in mono or output layout is copied as is, anything else via float
+        if data.dtype == np.int16:
+            if self.store_int16 and data.reshape(frames, -1).shape[1] in (1, self.channels):
+                stored = np.empty((frames, self.channels), dtype=np.int16)
+                np.copyto(stored, data.reshape(frames, -1))  # broadcasts mono
+                stored.setflags(write=False)
+                return stored
+            data = np.multiply(data, np.float32(INT16_SCALE), dtype=np.float32)
+
+        # Store in the output layout so playback never has to expand channels
+        if self.store_int16:
+            # Scale, round, clip and expand mono to the output layout in one
+            # compiled pass, with no full-size float temporaries
+            if data.ndim == 1:
+                data = data[:, None]
+            elif data.shape[1] not in (1, self.channels):
+                data = data.mean(axis=1, keepdims=True, dtype=np.float32)
+            data = quantize_int16(np.asarray(data, dtype=np.float32), self.channels)
+        else:
+            data = _to_channels(data, self.channels)
+            if not data.flags.owndata:
+                data = data.copy()
+        # Shared with playing sounds, so nobody may modify it in place
+        data.setflags(write=False)
+        return data
 
-    def _read_audio_file(self, file_path: str) -> Tuple[np.ndarray, int]:
+    def _to_float(self, data: np.ndarray) -> np.ndarray:
+        """Return a cached array as float32 (the read-only array itself if already float32)."""
+        if data.dtype == np.int16:
+            return np.multiply(data, np.float32(INT16_SCALE), dtype=np.float32)
+        return data
+
+    def _read_audio_file(
+        self, file_path: str, prefer_int16: bool = False
+    ) -> Tuple[np.ndarray, int]:
         """
         Read an audio file. Delegates to module-level read_audio_file function.
         """
-        return read_audio_file(file_path)
+        return read_audio_file(file_path, prefer_int16)
 
     def get_sound_data(self, file_path: str) -> Optional[np.ndarray]:
         """
-        Get pre-loaded audio data for a sound file.
+        Get pre-loaded audio data for a sound file as float32.
 
-        Returns cached data if available, otherwise loads and caches it.
+        Returns cached data if available, otherwise loads and caches it. The
+        result may be the shared cached array, which is read-only; callers
+        that need to modify it must copy it first.
         """
-        # Get cached data reference under lock, but copy OUTSIDE lock
-        # This reduces lock contention when clicking rapidly
-        cached_data = None
-        with self._lock:
-            if file_path in self._cache:
-                cached_data = self._cache[file_path]
-
+        # Lock-free read: dict.get is atomic under the GIL and writers only
+        # ever store or remove whole entries, so rapid clicks never contend
+        cached_data = self._cache.get(file_path)
         if cached_data is not None:
-            return cached_data.copy()
+            return self._to_float(cached_data)
 
         # Not in cache, try to load
         try:
-            return self._load_into_cache(file_path).copy()
-        except Exception as e:
-            print(f"Failed to load sound data for {file_path}: {e}")
+            return self._to_float(self._load_into_cache(file_path))
+        except Exception:
+            logger.exception("Failed to load sound data for %s", file_path)
             return None
 
+    def get_mix_data(self, file_path: str) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Get the cached array itself (no copy) and the gain that maps it to [-1, 1].
+
+        The array is read-only and may be int16; multiply by the returned scale
+        while mixing. Loads the sound if it is not cached yet.
+        """
+        data = self._cache.get(file_path)
+        if data is None:
+            try:
+                data = self._load_into_cache(file_path)
+            except Exception:
+                logger.exception("Failed to load sound data for %s", file_path)
+                return None
+        return data, (INT16_SCALE if data.dtype == np.int16 else 1.0)
+
+    def get_processed(
+        self, file_path: str, speed: float, preserve_pitch: bool
+    ) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Get a cached speed-adjusted copy (no copy) and its scale, like get_mix_data().
+
+        Returns None if this sound has not been stored at this speed yet.
+        """
+        key = (file_path, speed, preserve_pitch)
+        with self._lock:
+            data = self._processed.get(key)
+            if data is None:
+                return None
+            self._processed.move_to_end(key)
+        return data, (INT16_SCALE if data.dtype == np.int16 else 1.0)
+
+    def has_processed(self, file_path: str, speed: float, preserve_pitch: bool) -> bool:
+        """Check if a speed-adjusted copy is cached."""
+        return (file_path, speed, preserve_pitch) in self._processed
+
+    def store_processed(
+        self, file_path: str, speed: float, preserve_pitch: bool, data: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Cache a speed-adjusted copy of a sound and return it like get_processed().
+
+        Least recently used copies are evicted once the total exceeds
+        max_processed_bytes; a copy larger than that is returned uncached.
+        """
+        key = (file_path, speed, preserve_pitch)
+        data = self._to_stored(data)
+        scale = INT16_SCALE if data.dtype == np.int16 else 1.0
+        if data.nbytes > self.max_processed_bytes:
+            return data, scale
+        with self._lock:
+            old = self._processed.pop(key, None)
+            if old is not None:
+                self._processed_bytes -= old.nbytes
+            self._processed[key] = data
+            self._processed_bytes += data.nbytes
+            while self._processed_bytes > self.max_processed_bytes:
+                _, evicted = self._processed.popitem(last=False)
+                self._processed_bytes -= evicted.nbytes
+        return data, scale
+
+    def _drop_processed(self, file_path: Optional[str] = None):
+        """Drop cached speed-adjusted copies of one sound (or all). Caller holds _lock."""
+        for key in [k for k in self._processed if file_path is None or k[0] == file_path]:
+            self._processed_bytes -= self._processed.pop(key).nbytes
+
     def preload_sounds(self, file_paths: List[str]):
-        """Pre-load multiple sounds into cache (call on startup)."""
-        for path in file_paths:
-            if path and os.path.exists(path):
+        """Pre-load multiple sounds into cache (call on startup).
+
+        Files are decoded in parallel: reading, decoding and resampling all
+        release the GIL, so startup scales with the number of cores.
+        """
+        paths = [p for p in dict.fromkeys(file_paths) if p and os.path.exists(p)]
+        if not paths:
+            return
+        workers = min(len(paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._load_into_cache, path): path for path in paths}
+            for future in as_completed(futures):
                 try:
-                    self._load_into_cache(path)
-                except Exception as e:
-                    print(f"Failed to preload {path}: {e}")
+                    future.result()
+                except Exception:
+                    logger.exception("Failed to preload %s", futures[future])
 
     def remove_sound(self, file_path: str, delete_file: bool = True):
         """Remove a sound from cache and optionally delete the file."""
         with self._lock:
             if file_path in self._cache:
                 del self._cache[file_path]
+            self._drop_processed(file_path)
 
         if delete_file:
             path = Path(file_path)
             if path.exists() and path.parent == self.sounds_dir:
                 try:
                     path.unlink()
-                except Exception as e:
-                    print(f"Failed to delete sound file: {e}")
+                except Exception:
+                    logger.exception("Failed to delete sound file %s", path)
 
     def clear_cache(self):
         """Clear the in-memory cache (files remain on disk)."""
         with self._lock:
             self._cache.clear()
+            self._drop_processed()
 
     def is_cached(self, file_path: str) -> bool:
         """Check if a sound is already in the cache."""
-        with self._lock:
-            return file_path in self._cache
+        return file_path in self._cache
 
     def get_sound_duration(self, file_path: str) -> float:
         """Get the duration of a sound in seconds (without copying data)."""
-        with self._lock:
-            if file_path in self._cache:
-                return len(self._cache[file_path]) / self.sample_rate
+        cached_data = self._cache.get(file_path)
+        if cached_data is not None:
+            return len(cached_data) / self.sample_rate
 
-        # Not cached - try to load it first
-        data = self.get_sound_data(file_path)
-        if data is not None:
-            return len(data) / self.sample_rate
-        return 0.0
+        # Not cached - read the header only (no decode) when libsndfile can
+        try:
+            info = sf.info(file_path)
+            if info.frames > 0 and info.samplerate > 0:
+                return info.frames / info.samplerate
+        except Exception:
+            pass  # Containers soundfile cannot read are decoded below
+
+        try:
+            return len(self._load_into_cache(file_path)) / self.sample_rate
+        except Exception:
+            logger.exception("Failed to load sound data for %s", file_path)
+            return 0.0
 
 
 class AudioMixer:
@@ -569,14 +979,50 @@ class AudioMixer:
         self.running = False
         self.input_stream = None
         self.output_stream = None
-        self.sound_queue: queue.Queue = queue.Queue()
-        self.currently_playing: List[Dict] = []
-        self.lock = threading.Lock()
-
-        # Queue for mic input (handles timing mismatches between input/output)
-        self._mic_queue: queue.Queue = queue.Queue(maxsize=8)
+        # Playing sounds as structure-of-arrays voice slots, owned by the audio
+        # thread: other threads only read them and change them through
+        # _post_command(). Hot per-block state lives in numpy arrays for
+        # mix_voices(); loop bookkeeping and UI fields stay in _voice_meta dicts.
+        # Every voice holds read-only data of one dtype (the cache's storage
+        # format), so all of them fit in the kernel's typed list.
+        self._voice_dtype = np.int16 if sound_cache and sound_cache.store_int16 else np.float32
+        self._empty_voice = np.zeros((0, self.channels), dtype=self._voice_dtype)
+        self._empty_voice.setflags(write=False)
+        self._voice_data = new_voice_list(0, self.channels, self._voice_dtype, readonly=True)
+        self._voice_positions = np.zeros(0, dtype=np.int64)
+        self._voice_lengths = np.zeros(0, dtype=np.int64)
+        self._voice_gains = np.zeros(0, dtype=np.float32)  # volume * scale
+        # First frame of each voice's fade-out (its length if it does not fade).
+        # The fade is applied while mixing, so cached data is never copied to fade it
+        self._voice_fade_starts = np.zeros(0, dtype=np.int64)
+        self._fade_curve = _get_fade_curve(int(self.sample_rate * _FADE_OUT_MS / 1000))
+        self._voice_flags = np.zeros(0, dtype=np.uint8)  # VOICE_* bits, 0 = free slot
+        self._voice_meta: List[Optional[Dict]] = []
+        self._voice_seq = 0  # start order, so the UI lists sounds oldest first
+        self._free_voices: List[int] = []  # free slots, next one to use last
+        self._grow_voices(16)
+        # (func, args) commands for the audio thread, including newly queued
+        # sounds. deque append/popleft are atomic, so no lock is ever taken
+        # in the output callback and commands apply in the order posted
+        self._commands: collections.deque = collections.deque()
+        # Serializes commands run on caller threads while no stream is
+        # running (see _post_command); the audio thread never takes it
+        self._commands_lock = threading.Lock()
+        # Sounds still being processed on a background thread (time-stretch).
+        # Only producers take the lock; the audio thread just reads the int
+        self._preparing = 0
+        self._preparing_lock = threading.Lock()
+
+        # Ring of mic input blocks (handles timing mismatches between input/output)
+        self._mic_ring = RingBuffer(8, self.block_size, 1)
+        self._mic_block = np.zeros((self.block_size, 1), dtype=np.float32)
         # Fallback buffer when queue is empty (prevents choppy audio)
         self._last_mic_data = np.zeros((self.block_size,), dtype=np.float32)
+        # Mix buffers reused by every output callback (see _alloc_mix_buffers)
+        self._alloc_mix_buffers(self.block_size)
+
+        # Output underflows reported by PortAudio since start()
+        self._output_underflows = 0
 
         # Mic settings
         self.mic_volume = 1.0
@@ -603,7 +1049,9 @@ class AudioMixer:
         # Local monitoring (play sounds to speakers too)
         self.monitor_enabled = False
         self.monitor_stream = None
-        self._monitor_queue: queue.Queue = queue.Queue()  # Queue for monitor audio blocks
+        # Ring of sounds-only blocks for the monitor stream, stored as the int16
+        # PCM the monitor stream plays so each block is converted only once
+        self._monitor_ring = RingBuffer(8, self.block_size, self.channels, dtype=np.int16)
 
         # Shutdown flag - signals background threads to abort
         self._shutting_down = False
@@ -611,11 +1059,21 @@ class AudioMixer:
         # Start PTT worker thread
         self._start_ptt_thread()
 
+    def _alloc_mix_buffers(self, frames: int):
+        """Allocate the output callback's work buffers for blocks of up to `frames`."""
+        shape = (frames, self.channels)
+        self._mixed_buf = np.zeros(shape, dtype=np.float32)  # mic + sounds
+        self._sounds_buf = np.zeros(shape, dtype=np.float32)  # sounds only, for monitoring
+        self._scratch = np.zeros(shape, dtype=np.float32)  # one sound's scaled block
+        self._clip_buf = np.zeros(shape, dtype=np.float32)  # _soft_clip work buffer
+
     def _start_ptt_thread(self):
         """Start the background thread that processes PTT commands."""
 
         def ptt_worker():
             """Process PTT commands from queue in background thread."""
+            # Key presses must not wait behind busy UI/decoder threads
+            _set_current_thread_priority(_THREAD_PRIORITY_ABOVE_NORMAL)
             while not self._shutting_down:
                 try:
                     # Wait for command with timeout so we can check shutdown flag
@@ -690,7 +1148,10 @@ class AudioMixer:
         if self.running:
             return
 
-        self.running = True
+        # Callers that saw running=False finish applying their commands first
+        with self._commands_lock:
+            self.running = True
+        self._output_underflows = 0
 
         # Create separate input stream for microphone
         self.input_stream = sd.InputStream(
@@ -723,6 +1184,9 @@ class AudioMixer:
         # CRITICAL: Release PTT key first to prevent Windows UI freeze
         self._force_release_ptt(shutdown=True)
 
+        if self._output_underflows:
+            logger.warning("Output stream underflowed %d times", self._output_underflows)
+
         # Use abort() instead of stop() for faster, non-blocking shutdown
         if self.input_stream:
             try:
@@ -746,24 +1210,91 @@ class AudioMixer:
                 pass
             self.monitor_stream = None
 
-        # Clear any pending sounds
-        with self.lock:
-            self.currently_playing.clear()
-        while not self.sound_queue.empty():
+        # Clear any pending sounds (the streams are gone, so nothing else owns the voices)
+        with self._commands_lock:
+            self._commands.clear()
+            self._clear_voices()
+
+    def _post_command(self, func, *args):
+        """Run func(*args) on the audio thread before the next block is mixed.
+
+        Applied immediately when no stream is running to consume it, one
+        calling thread at a time.
+        """
+        self._commands.append((func, args))
+        if not self.running:
+            with self._commands_lock:
+                if not self.running:
+                    self._run_commands()
+
+    def _run_commands(self):
+        """Apply every posted command, oldest first."""
+        commands = self._commands
+        while True:
             try:
-                self.sound_queue.get_nowait()
-            except queue.Empty:
+                func, args = commands.popleft()
+            except IndexError:
                 break
+            func(*args)
+
+    def _voices_in_order(self) -> List[Tuple[int, Dict]]:
+        """(slot, meta) of all playing voices, oldest first.
+
+        Safe to call from other threads as a read-only snapshot.
+        """
+        voices = []
+        for v in np.flatnonzero(self._voice_flags).tolist():
+            meta = self._voice_meta[v]
+            if meta is not None:  # May be freed concurrently
+                voices.append((v, meta))
+        voices.sort(key=lambda voice: voice[1]["seq"])
+        return voices
+
+    def _find_voice(self, sound_id: str) -> Optional[int]:
+        """Return the slot of the oldest playing sound with this ID, or None."""
+        for v, meta in self._voices_in_order():
+            if meta.get("sound_id") == sound_id:
+                return v
+        return None
+
+    def _grow_voices(self, count: int):
+        """Add `count` free voice slots (only when every slot is taken)."""
+        start = len(self._voice_flags)
+        self._voice_positions = np.concatenate(
+            [self._voice_positions, np.zeros(count, dtype=np.int64)]
+        )
+        self._voice_lengths = np.concatenate([self._voice_lengths, np.zeros(count, dtype=np.int64)])
+        self._voice_gains = np.concatenate([self._voice_gains, np.zeros(count, dtype=np.float32)])
+        self._voice_fade_starts = np.concatenate(
+            [self._voice_fade_starts, np.zeros(count, dtype=np.int64)]
+        )
+        self._voice_flags = np.concatenate([self._voice_flags, np.zeros(count, dtype=np.uint8)])
+        self._voice_scan = np.zeros(len(self._voice_flags), dtype=np.int64)  # scan_voices() output
+        self._voice_meta.extend([None] * count)
+        for _ in range(count):
+            self._voice_data.append(self._empty_voice)
+        self._free_voices.extend(range(start + count - 1, start - 1, -1))
+
+    def _to_voice_data(self, data: np.ndarray) -> Tuple[np.ndarray, float]:
+        """Return data as a read-only (N, channels) array of the voice dtype, and its scale."""
+        if self._voice_dtype == np.int16:
+            if data.dtype != np.int16:
+                samples = np.asarray(data, dtype=np.float32).reshape(len(data), -1)
+                data = quantize_int16(samples, self.channels)
+            scale = INT16_SCALE
+        else:
+            if data.dtype == np.int16:
+                data = np.multiply(data, np.float32(INT16_SCALE), dtype=np.float32)
+            scale = 1.0
+        data = np.ascontiguousarray(data)
+        data.setflags(write=False)
+        return data, scale
 
     def set_monitor_enabled(self, enabled: bool):
         """Enable or disable local speaker monitoring."""
         if enabled and not self.monitor_stream and self.running:
-            # Clear the monitor queue before starting
-            while not self._monitor_queue.empty():
-                try:
-                    self._monitor_queue.get_nowait()
-                except queue.Empty:
-                    break
+            # Clear the monitor ring before starting
+            self._monitor_ring.clear()
             # Start monitor stream (outputs to default device)
             self.monitor_stream = sd.OutputStream(
                 device=None,  # Default speakers
@@ -771,7 +1302,7 @@ class AudioMixer:
                 blocksize=self.block_size,
                 channels=self.channels,
                 callback=self._monitor_callback,
-                dtype=np.float32,
+                dtype=np.int16,
             )
             self.monitor_stream.start()
             self.monitor_enabled = True
@@ -784,33 +1315,16 @@ class AudioMixer:
 
     def _monitor_callback(self, outdata, frames, time, status):
         """Output callback for local speaker monitoring (plays mixed audio)."""
-        try:
-            # Get audio data from queue (non-blocking)
-            audio_block = self._monitor_queue.get_nowait()
-            if len(audio_block) >= frames:
-                outdata[:] = audio_block[:frames]
-            else:
-                outdata[: len(audio_block)] = audio_block
-                outdata[len(audio_block) :] = 0
-        except queue.Empty:
-            # No audio data available, output silence
-            outdata.fill(0)
+        # Copy the next block straight into outdata; silence for whatever is missing
+        n = self._monitor_ring.read_into(outdata)
+        if n < frames:
+            outdata[n:] = 0
 
     def _input_callback(self, indata, frames, time, status):
-        """Capture microphone input into queue."""
-        # Extract mono channel
-        mic_data = indata[:, 0].copy()
-
-        # Try to add to queue (non-blocking)
-        try:
-            self._mic_queue.put_nowait(mic_data)
-        except queue.Full:
-            # Queue full - discard oldest and add new (prevents falling behind)
-            try:
-                self._mic_queue.get_nowait()
-                self._mic_queue.put_nowait(mic_data)
-            except queue.Empty:
-                pass
+        """Capture microphone input into the mic ring."""
+        # Mono channel only; if the ring is full the oldest block is dropped
+        # (prevents falling behind)
+        self._mic_ring.write(indata[:, :1])
 
     def _output_callback(self, outdata, frames, time, status):
         """
@@ -819,17 +1333,21 @@ class AudioMixer:
         Called by sounddevice for each audio block.
         Keep this minimal - no blocking operations!
         """
-        # Get microphone input from queue (handles timing variations)
-        try:
-            mic_data = self._mic_queue.get_nowait()
-            # Only use if size matches, otherwise fall back
-            if len(mic_data) == frames:
-                self._last_mic_data = mic_data.copy()
-            else:
-                mic_data = self._last_mic_data
-        except queue.Empty:
-            # No new data - use last known data (prevents choppy audio)
-            mic_data = self._last_mic_data
+        if status and status.output_underflow:
+            # Counted here, logged from stop() (logging is not realtime-safe)
+            self._output_underflows += 1
+
+        self._mix_block(outdata, frames)
+
+    def _mix_block(self, outdata, frames):
+        """Mix mic input and all playing sounds into outdata (frames, channels)."""
+        # Get microphone input from the ring (handles timing variations).
+        # With no new data (or a size mismatch) reuse the last block to prevent choppy audio
+        if self._mic_ring.read_into(self._mic_block) == frames:
+            if len(self._last_mic_data) != frames:
+                self._last_mic_data = np.zeros(frames, dtype=np.float32)
+            self._last_mic_data[:] = self._mic_block[:frames, 0]
+        mic_data = self._last_mic_data
 
         # Ensure mic_data is valid (resize fallback if needed)
         if len(mic_data) != frames:
@@ -837,105 +1355,55 @@ class AudioMixer:
             self._last_mic_data = np.zeros(frames, dtype=np.float32)
             mic_data = self._last_mic_data
 
-        # Initialize sounds-only buffer for monitoring
-        sounds_mix = np.zeros((frames, self.channels), dtype=np.float32)
-
-        # Process microphone input
-        if self.mic_muted:
-            mixed = np.zeros((frames, self.channels), dtype=np.float32)
-        else:
-            mic_mono = mic_data * self.mic_volume
-            mixed = np.column_stack([mic_mono, mic_mono])
-
-        # Add newly queued sounds to currently playing
-        while not self.sound_queue.empty():
-            try:
-                sound_data = self.sound_queue.get_nowait()
-                with self.lock:
-                    self.currently_playing.append(sound_data)
-            except queue.Empty:
-                break
-
-        # Mix all currently playing sounds
-        with self.lock:
-            finished = []
-            for i, sound in enumerate(self.currently_playing):
-                # Skip paused sounds
-                if sound.get("paused", False):
-                    continue
-
-                # Handle loop delay phase
-                if sound.get("in_delay", False):
-                    delay_remaining = sound["loop_delay_samples"] - sound["delay_position"]
-                    if delay_remaining <= 0:
-                        # Delay finished, reset for next loop iteration
-                        sound["in_delay"] = False
-                        sound["position"] = 0
-                        sound["delay_position"] = 0
-                        # Decrement loops_remaining if not infinite
-                        if sound.get("loops_remaining", 0) > 0:
-                            sound["loops_remaining"] -= 1
-                    else:
-                        # Still in delay - add silence
-                        sound["delay_position"] += frames
-                        continue
-
-                pos = sound["position"]
-                data = sound["data"]
-                volume = sound["volume"]
-                remaining = len(data) - pos
-
-                if remaining <= 0:
-                    # Sound finished this iteration
-                    if sound.get("loop", False):
-                        # Check if more loops remain
-                        loops_remaining = sound.get("loops_remaining", -1)
-                        if loops_remaining != 0:  # -1 = infinite, >0 = more loops
-                            # Start delay phase if configured
-                            if sound.get("loop_delay_samples", 0) > 0:
-                                sound["in_delay"] = True
-                                sound["delay_position"] = 0
-                            else:
-                                # No delay, reset immediately
-                                sound["position"] = 0
-                                if loops_remaining > 0:
-                                    sound["loops_remaining"] -= 1
-                            continue
-                    # Not looping or no more loops - mark as finished
-                    finished.append(i)
-                    continue
-
-                chunk_size = min(frames, remaining)
-                chunk = data[pos : pos + chunk_size] * volume
-
-                # Convert mono to stereo if needed
-                if chunk.ndim == 1:
-                    chunk = np.column_stack([chunk, chunk])
-                elif chunk.shape[1] == 1:
-                    chunk = np.column_stack([chunk[:, 0], chunk[:, 0]])
-
-                # Pad if chunk is smaller than frame size
-                if chunk_size < frames:
-                    padded = np.zeros((frames, self.channels), dtype=np.float32)
-                    padded[:chunk_size] = chunk
-                    chunk = padded
-
-                # Add to both main mix and sounds-only mix
-                mixed += chunk
-                sounds_mix += chunk
-                sound["position"] += chunk_size
+        if len(self._scratch) < frames:
+            # Only if the host delivers a larger block than requested
+            self._alloc_mix_buffers(frames)
+        scratch = self._scratch
+        mixed = self._mixed_buf[:frames]
+
+        # Sounds are mixed into the sounds-only buffer (also used for monitoring);
+        # the mic is added on top in a single pass afterwards
+        sounds_mix = self._sounds_buf[:frames]
+        sounds_mix.fill(0.0)
+
+        # Apply queued sounds and control changes, then mix all currently playing sounds
+        self._run_commands()
+
+        # Voices waiting out a loop delay or past their end need per-voice
+        # bookkeeping (rare); everything else is mixed by one compiled call
+        flags = self._voice_flags
+        found, playing = scan_voices(
+            flags, self._voice_positions, self._voice_lengths, self._voice_scan
+        )
+        for i in range(found):
+            if self._voice_boundary(int(self._voice_scan[i]), frames):
+                playing -= 1
+
+        # Sound data is C-contiguous (N, channels), see _to_voice_data(); int16
+        # voices are converted to float by their gain (volume * scale), and each
+        # voice covers only the frames it has (no zero padding needed)
+        mix_voices(
+            sounds_mix,
+            self._voice_data,
+            self._voice_positions,
+            self._voice_lengths,
+            self._voice_fade_starts,
+            self._fade_curve,
+            self._voice_gains,
+            flags,
+            scratch,
+        )
 
-            # Remove finished sounds
-            for i in reversed(finished):
-                self.currently_playing.pop(i)
+        # Check if we should start PTT release countdown
+        # Only count sounds that are actively producing audio (not paused)
+        all_sounds_finished = playing == 0
 
-            # Check if we should start PTT release countdown
-            # Only count sounds that are actively producing audio (not paused)
-            active_sounds = sum(1 for s in self.currently_playing if not s.get("paused", False))
-            all_sounds_finished = active_sounds == 0
+        # Microphone (mono broadcast into every output channel) plus all sounds
+        mic_gain = 0.0 if self.mic_muted else self.mic_volume
+        add_mic(mixed, sounds_mix, mic_data, np.float32(mic_gain))
 
         # Handle PTT release with debounce to prevent premature release
-        if all_sounds_finished and self.sound_queue.empty():
+        if all_sounds_finished and not self._commands and not self._preparing:
             # No sounds playing - increment or start countdown
             if self.ptt_active:
                 self._ptt_release_countdown += 1
@@ -963,16 +1431,62 @@ class AudioMixer:
         # Apply soft clipping to allow volume boost above 100% to sound louder
         # This soft limiter preserves normal audio but compresses peaks above 1.0
         # instead of hard clipping, so volume boost actually increases loudness
-        outdata[:] = self._soft_clip(mixed)
+        self._soft_clip(mixed, out=outdata)
 
         # Queue sounds-only for local speaker monitoring
-        if self.monitor_enabled and np.any(sounds_mix):
-            # Only queue if there's actual sound data (not silence)
-            clipped = self._soft_clip(sounds_mix).astype(np.float32)
-            try:
-                self._monitor_queue.put_nowait(clipped.copy())
-            except queue.Full:
-                pass  # Drop frame if queue is full
+        if self.monitor_enabled and not all_sounds_finished:
+            # Only queue while sounds are playing (known from the voice scan, so
+            # silence needs no pass over the buffer). Soft clip, then convert
+            # to int16 in place (sounds_mix is rebuilt every block)
+            monitor = self._soft_clip(sounds_mix, out=sounds_mix)
+            np.multiply(monitor, 32767.0, out=monitor)
+            np.clip(monitor, -32768.0, 32767.0, out=monitor)
+            np.rint(monitor, out=monitor)
+            self._monitor_ring.write(monitor)
+
+    def _voice_boundary(self, v: int, frames: int) -> bool:
+        """Handle a voice in its loop delay or at its end. Audio thread only.
+
+        Returns True if the voice finished and its slot was freed.
+        """
+        meta = self._voice_meta[v]
+        flags = self._voice_flags
+
+        # Handle loop delay phase
+        if flags[v] & VOICE_IN_DELAY:
+            if meta["loop_delay_samples"] - meta["delay_position"] > 0:
+                # Still in delay - add silence
+                meta["delay_position"] += frames
+                return False
+            # Delay finished, reset for next loop iteration
+            flags[v] = int(flags[v]) & ~VOICE_IN_DELAY
+            self._voice_positions[v] = 0
+            meta["delay_position"] = 0
+            # Decrement loops_remaining if not infinite
+            if meta["loops_remaining"] > 0:
+                meta["loops_remaining"] -= 1
+            if self._voice_lengths[v] > 0:
+                return False  # Mixed from the start this block
+
+        # Sound finished this iteration
+        if meta["loop"]:
+            # Check if more loops remain
+            loops_remaining = meta["loops_remaining"]
+            if loops_remaining != 0:  # -1 = infinite, >0 = more loops
+                # Start delay phase if configured
+                if meta["loop_delay_samples"] > 0:
+                    flags[v] = int(flags[v]) | VOICE_IN_DELAY
+                    meta["delay_position"] = 0
+                else:
+                    # No delay, reset immediately (mixing resumes next block)
+                    self._voice_positions[v] = 0
+                    flags[v] = int(flags[v]) | VOICE_HOLD
+                    if loops_remaining > 0:
+                        meta["loops_remaining"] -= 1
+                return False
+        # Not looping or no more loops - free the slot
+        self._release_voice(v)
+        return True
 
     def play_sound(
         self,
@@ -1010,21 +1524,46 @@ class AudioMixer:
         self._ptt_release_countdown = 0
 
         # If speed change with librosa is needed, run in background thread to avoid UI freeze
-        if speed != 1.0 and preserve_pitch and LIBROSA_AVAILABLE:
+        # (unless this speed is already cached, which makes playback a plain lookup)
+        if (
+            speed != 1.0
+            and preserve_pitch
+            and LIBROSA_AVAILABLE
+            and not (
+                self.sound_cache
+                and self.sound_cache.has_processed(file_path, speed, preserve_pitch)
+            )
+        ):
             # Run processing in background thread
             def process_and_play():
-                self._play_sound_sync(
-                    file_path, volume, speed, preserve_pitch, sound_id, loop, loop_count, loop_delay
-                )
+                try:
+                    self._play_sound_sync(
+                        file_path,
+                        volume,
+                        speed,
+                        preserve_pitch,
+                        sound_id,
+                        loop,
+                        loop_count,
+                        loop_delay,
+                    )
+                finally:
+                    # The sound is already posted, so PTT is never released in between
+                    with self._preparing_lock:
+                        self._preparing -= 1
+
+            # Keep PTT held while the sound is processed
+            with self._preparing_lock:
+                self._preparing += 1
 
             thread = threading.Thread(target=process_and_play, daemon=True)
             thread.start()
 
             # Return estimated duration (actual may differ slightly after time-stretch)
             if self.sound_cache:
-                data = self.sound_cache.get_sound_data(file_path)
-                if data is not None:
-                    return len(data) / self.sample_rate / speed
+                duration = self.sound_cache.get_sound_duration(file_path)
+                if duration:
+                    return duration / speed
             return 1.0  # Fallback estimate
 
         # For normal speed or simple resample, run synchronously (fast)
@@ -1056,37 +1595,25 @@ class AudioMixer:
         try:
             # Use cached audio data if available (much faster - no disk I/O)
             if self.sound_cache:
-                data = self.sound_cache.get_sound_data(file_path)
+                # Mix the cached (possibly int16, read-only) array directly, with
+                # no copy: the fade-out is applied while mixing. Speed changes
+                # (librosa time-stretch if preserve_pitch=True) are processed on
+                # first use and cached per speed
+                mix = self._get_speed_data(file_path, speed, preserve_pitch)
+                data, scale = mix if mix is not None else (None, 1.0)
                 if data is not None:
-                    # Apply speed adjustment (uses librosa time-stretch if preserve_pitch=True)
-                    if speed != 1.0:
-                        data = self._apply_speed(data, speed, preserve_pitch)
-                    # Apply fade-out to prevent abrupt cutoff (skip for looping sounds)
-                    if not loop:
-                        data = _apply_fade_out(data, self.sample_rate)
-                    # Queue sound FIRST, then press PTT (prevents race condition where
-                    # output callback sees empty queue and releases PTT immediately)
-                    sound_entry = {
-                        "data": data,
-                        "position": 0,
-                        "volume": volume,
-                        "sound_id": sound_id,
-                        "loop": loop,
-                        "loop_count": loop_count,
-                        "loops_remaining": loop_count if loop_count > 0 else -1,
-                        "loop_delay": loop_delay,
-                        "loop_delay_samples": int(loop_delay * self.sample_rate),
-                        "in_delay": False,
-                        "delay_position": 0,
-                        "file_path": file_path,
-                        "speed": speed,
-                        "preserve_pitch": preserve_pitch,
-                        "name": Path(file_path).stem if file_path else "Unknown",
-                        "paused": False,
-                    }
-                    self.sound_queue.put(sound_entry)
-                    if not skip_ptt:
-                        self._press_ptt()
+                    duration = self._queue_sound(
+                        data,
+                        file_path,
+                        volume,
+                        speed,
+                        preserve_pitch,
+                        sound_id,
+                        loop,
+                        loop_count,
+                        loop_delay,
+                        skip_ptt,
+                    )
                     logger.debug(
                         "Queued from cache: %d samples (speed=%s, preserve_pitch=%s, volume=%s, id=%s, loop=%s)",
                         len(data),
@@ -1096,7 +1623,7 @@ class AudioMixer:
                         sound_id,
                         loop,
                     )
-                    return len(data) / self.sample_rate
+                    return duration
 
             # Fallback: load from disk (slower) - uses pydub for OGG/M4A/etc
             if not os.path.exists(file_path):
@@ -1107,6 +1634,7 @@ class AudioMixer:
             # Resample if needed
             if sr != self.sample_rate:
                 data = _resample_audio(data, sr, self.sample_rate)
+            data = _to_channels(data, self.channels)
 
             # Apply speed adjustment (fast - simple resampling)
             if speed != 1.0:
@@ -1114,10 +1642,6 @@ class AudioMixer:
                     return 0.0
                 data = self._apply_speed(data, speed, preserve_pitch)
 
-            # Apply fade-out to prevent abrupt cutoff (skip for looping sounds)
-            if not loop:
-                data = _apply_fade_out(data, self.sample_rate)
-
             logger.debug(
                 "Playing from disk: %d samples (speed=%s, preserve_pitch=%s, id=%s, loop=%s)",
                 len(data),
@@ -1126,33 +1650,87 @@ class AudioMixer:
                 sound_id,
                 loop,
             )
-            # Queue sound FIRST, then press PTT
-            sound_entry = {
-                "data": data,
-                "position": 0,
-                "volume": volume,
-                "sound_id": sound_id,
-                "loop": loop,
-                "loop_count": loop_count,
-                "loops_remaining": loop_count if loop_count > 0 else -1,
-                "loop_delay": loop_delay,
-                "loop_delay_samples": int(loop_delay * self.sample_rate),
-                "in_delay": False,
-                "delay_position": 0,
-                "file_path": file_path,
-                "speed": speed,
-                "preserve_pitch": preserve_pitch,
-                "name": Path(file_path).stem if file_path else "Unknown",
-                "paused": False,
-            }
-            self.sound_queue.put(sound_entry)
-            if not skip_ptt:
-                self._press_ptt()
-            return len(data) / self.sample_rate
+            return self._queue_sound(
+                data,
+                file_path,
+                volume,
+                speed,
+                preserve_pitch,
+                sound_id,
+                loop,
+                loop_count,
+                loop_delay,
+                skip_ptt,
+            )
         except Exception as e:
             logger.error("Error loading sound: %s", e)
             return 0.0
 
+    def _queue_sound(
+        self,
+        data: np.ndarray,
+        file_path: str,
+        volume: float,
+        speed: float,
+        preserve_pitch: bool,
+        sound_id: Optional[str],
+        loop: bool,
+        loop_count: int,
+        loop_delay: float,
+        skip_ptt: bool,
+    ) -> float:
+        """Hand prepared audio to the audio thread and press PTT. Returns the duration.
+
+        Everything the audio thread needs per block (voice data, scale, loop delay in
+        samples) is computed here once, so the callback never recomputes it.
+        """
+        data, scale = self._to_voice_data(data)
+        sound_entry = {
+            "data": data,
+            "scale": scale,
+            "position": 0,
+            "volume": volume,
+            "sound_id": sound_id,
+            "loop": loop,
+            "loop_count": loop_count,
+            "loops_remaining": loop_count if loop_count > 0 else -1,
+            "loop_delay": loop_delay,
+            "loop_delay_samples": int(loop_delay * self.sample_rate),
+            "in_delay": False,
+            "delay_position": 0,
+            "file_path": file_path,
+            "speed": speed,
+            "preserve_pitch": preserve_pitch,
+            "name": Path(file_path).stem if file_path else "Unknown",
+            "paused": False,
+        }
+        # Queue sound FIRST, then press PTT (prevents race condition where
+        # output callback sees no sounds and releases PTT immediately)
+        self._post_command(self._add_sound, sound_entry)
+        if not skip_ptt:
+            self._press_ptt()
+        return len(data) / self.sample_rate
+
+    def _get_speed_data(
+        self, file_path: str, speed: float, preserve_pitch: bool
+    ) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Get a sound's cached data at the given speed (no copy) and its scale.
+
+        Speed-adjusted copies are processed once and then served from the
+        sound cache. Returns None if the sound cannot be loaded.
+        """
+        if speed == 1.0:
+            return self.sound_cache.get_mix_data(file_path)
+        cached = self.sound_cache.get_processed(file_path, speed, preserve_pitch)
+        if cached is not None:
+            return cached
+        data = self.sound_cache.get_sound_data(file_path)
+        if data is None or self._shutting_down:
+            return None
+        data = self._apply_speed(data, speed, preserve_pitch)
+        return self.sound_cache.store_processed(file_path, speed, preserve_pitch, data)
+
     def _apply_speed(
         self, data: np.ndarray, speed: float, preserve_pitch: bool = True
     ) -> np.ndarray:
@@ -1179,28 +1757,30 @@ class AudioMixer:
         # Use librosa time_stretch for pitch preservation if available and requested
         if preserve_pitch and LIBROSA_AVAILABLE:
             try:
-                # Serialize librosa calls to prevent CPU saturation
-                with _librosa_lock:
-                    # Convert stereo to mono for librosa, then back
+                # Bound concurrent librosa calls to prevent CPU saturation
+                with _librosa_slots:
+                    # librosa stretches (..., samples) arrays with the leading
+                    # axes batched through one STFT / phase vocoder / ISTFT pass,
+                    # so all channels go in together as (channels, samples)
                     if data.ndim == 2:
-                        # Process each channel separately
-                        left = librosa.effects.time_stretch(data[:, 0], rate=speed)
-                        right = librosa.effects.time_stretch(data[:, 1], rate=speed)
-                        result = np.column_stack([left, right])
+                        result = librosa.effects.time_stretch(data.T, rate=speed).T
                     else:
                         result = librosa.effects.time_stretch(data, rate=speed)
-                    return result.astype(np.float32)
+                    return np.ascontiguousarray(result, dtype=np.float32)
             except Exception as e:
                 logger.warning("librosa time_stretch failed, falling back to resample: %s", e)
 
         # Fallback: simple resampling (changes pitch - chipmunk/deep voice effect)
         # Speed > 1.0 = faster + higher pitch
         # Speed < 1.0 = slower + lower pitch
-        new_sr = int(self.sample_rate * speed)
-        result = _resample_audio(data, new_sr, self.sample_rate)
-        return result.astype(np.float32)
-
-    def _soft_clip(self, x: np.ndarray) -> np.ndarray:
+        # Only the ratio matters, so resample by speed as a small fraction. The
+        # polyphase filter then stays a few thousand taps long for any speed
+        # (48000 * 1.2345 vs 48000 Hz would need 2469/2000 and ~50k taps)
+        ratio = Fraction(speed).limit_denominator(100)
+        result = _resample_audio(data, ratio.numerator, ratio.denominator)
+        return np.ascontiguousarray(result, dtype=np.float32)
+
+    def _soft_clip(self, x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
         """Apply soft limiting to prevent harsh clipping while allowing volume boost.
 
         Volume > 100% makes audio louder. This limiter:
@@ -1211,35 +1791,19 @@ class AudioMixer:
         At 150% volume on a normalized sound (peaks at 0.7):
         - 0.7 * 1.5 = 1.05 -> output ~1.02 (still louder than 1.0)
         - 0.5 * 1.5 = 0.75 -> output 0.75 (unchanged, full 50% boost)
+
+        x is a C-contiguous (frames, channels) float32 block. Writes into `out`
+        (a new array if None; may be x itself) and returns it. Blocks from the
+        output callback use preallocated work buffers, so nothing is allocated
+        per callback.
         """
-        # Fast path: no limiting needed for normal audio
-        max_abs = np.max(np.abs(x))
-        if max_abs <= 1.0:
-            return x.astype(np.float32)
-
-        abs_x = np.abs(x)
-        sign_x = np.sign(x)
-
-        # Start with original values (preserves values <= 1.0)
-        result = np.copy(x)
-
-        # Find samples above 1.0 that need limiting
-        hot = abs_x > 1.0
-
-        if np.any(hot):
-            # Map values above 1.0 to a compressed range
-            # Using curve: 1.0 + 0.4 * tanh((x - 1.0))
-            # This gives approximately:
-            #   input 1.0 -> output 1.0
-            #   input 1.2 -> output ~1.08
-            #   input 1.5 -> output ~1.16
-            #   input 2.0 -> output ~1.30
-            #   input 3.0 -> output ~1.38 (approaches 1.4)
-            excess = abs_x[hot] - 1.0
-            soft_output = 1.0 + 0.4 * np.tanh(excess)
-            result[hot] = sign_x[hot] * soft_output
-
-        return result.astype(np.float32)
+        if out is None:
+            out = np.empty(x.shape, dtype=np.float32)
+        scratch = self._clip_buf[: len(x)]
+        if scratch.shape != x.shape:
+            scratch = np.empty(x.shape, dtype=np.float32)
+        soft_clip(x, out, scratch)
+        return out
 
     def stop_sound(self, sound_id: str):
         """Stop a specific sound by its ID.
@@ -1247,54 +1811,16 @@ class AudioMixer:
         Args:
             sound_id: The identifier of the sound to stop
         """
-        logger.debug(
-            "Stop: id=%s, currently_playing=%d, ids=%s",
-            sound_id,
-            len(self.currently_playing),
-            [s.get("sound_id") for s in self.currently_playing],
-        )
-
-        with self.lock:
-            # Remove sounds with matching ID from currently_playing
-            before_count = len(self.currently_playing)
-            self.currently_playing = [
-                s for s in self.currently_playing if s.get("sound_id") != sound_id
-            ]
-            after_count = len(self.currently_playing)
-
-        logger.debug("Stop: removed %d sounds from currently_playing", before_count - after_count)
-
-        # Also drain matching sounds from queue
-        remaining = []
-        while not self.sound_queue.empty():
-            try:
-                sound = self.sound_queue.get_nowait()
-                if sound.get("sound_id") != sound_id:
-                    remaining.append(sound)
-            except queue.Empty:
-                break
-
-        # Put back non-matching sounds
-        for sound in remaining:
-            self.sound_queue.put(sound)
-
-        # Check if we should release PTT (no more sounds playing)
-        with self.lock:
-            if len(self.currently_playing) == 0 and self.sound_queue.empty():
-                # Force direct release for reliability (bypass queue)
-                self._force_release_ptt()
+        logger.debug("Stop: id=%s", sound_id)
+        self._post_command(self._remove_sound, sound_id)
 
     def stop_all_sounds(self):
-        """Clear playback queue and stop all sounds."""
-        with self.lock:
-            self.currently_playing.clear()
+        """Stop every sound: post a clear-all-voices command and force-release PTT.
 
-        # Drain the queue
-        while not self.sound_queue.empty():
-            try:
-                self.sound_queue.get_nowait()
-            except queue.Empty:
-                break
+        Sounds queued before this call are added first and then cleared with the
+        rest; other pending commands still apply in order.
+        """
+        self._post_command(self._clear_voices)
 
         # Force release PTT key directly (bypass queue for reliability)
         self._force_release_ptt()
@@ -1305,12 +1831,8 @@ class AudioMixer:
         Args:
             sound_id: The identifier of the sound to pause
         """
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    sound["paused"] = True
-                    logger.debug("Paused sound: %s", sound_id)
-                    break
+        logger.debug("Pause sound: %s", sound_id)
+        self._post_command(self._update_sound, sound_id, {"paused": True})
 
     def resume_sound(self, sound_id: str):
         """Resume a paused sound by its ID.
@@ -1318,12 +1840,8 @@ class AudioMixer:
         Args:
             sound_id: The identifier of the sound to resume
         """
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    sound["paused"] = False
-                    logger.debug("Resumed sound: %s", sound_id)
-                    break
+        logger.debug("Resume sound: %s", sound_id)
+        self._post_command(self._update_sound, sound_id, {"paused": False})
 
     def toggle_sound_loop(self, sound_id: str, loop: Optional[bool] = None):
         """Toggle or set the loop state of a playing sound.
@@ -1332,18 +1850,8 @@ class AudioMixer:
             sound_id: The identifier of the sound
             loop: If provided, sets the loop state; if None, toggles
         """
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    if loop is None:
-                        sound["loop"] = not sound.get("loop", False)
-                    else:
-                        sound["loop"] = loop
-                    # If enabling loop and loops_remaining was 0, set to infinite
-                    if sound["loop"] and sound.get("loops_remaining", 0) == 0:
-                        sound["loops_remaining"] = -1
-                    logger.debug("Toggled loop for %s: %s", sound_id, sound["loop"])
-                    break
+        logger.debug("Toggle loop for %s: %s", sound_id, loop)
+        self._post_command(self._set_loop, sound_id, loop)
 
     def set_sound_volume(self, sound_id: str, volume: float):
         """Set the volume of a currently playing sound.
@@ -1353,12 +1861,8 @@ class AudioMixer:
             volume: New volume (0.0 to 1.5)
         """
         volume = max(0.0, min(1.5, volume))
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    sound["volume"] = volume
-                    logger.debug("Set volume for %s: %.2f", sound_id, volume)
-                    break
+        logger.debug("Set volume for %s: %.2f", sound_id, volume)
+        self._post_command(self._update_sound, sound_id, {"volume": volume})
 
     def restart_sound(self, sound_id: str):
         """Restart a sound from the beginning.
@@ -1366,15 +1870,12 @@ class AudioMixer:
         Args:
             sound_id: The identifier of the sound to restart
         """
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    sound["position"] = 0
-                    sound["in_delay"] = False
-                    sound["delay_position"] = 0
-                    sound["paused"] = False
-                    logger.debug("Restarted sound: %s", sound_id)
-                    break
+        logger.debug("Restart sound: %s", sound_id)
+        self._post_command(
+            self._update_sound,
+            sound_id,
+            {"position": 0, "in_delay": False, "delay_position": 0, "paused": False},
+        )
 
     def set_sound_loop_count(self, sound_id: str, count: int):
         """Set the loop count for a currently playing sound.
@@ -1383,14 +1884,11 @@ class AudioMixer:
             sound_id: The identifier of the sound
             count: Number of remaining loops (0 = stop after current, -1 = infinite)
         """
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    sound["loops_remaining"] = count
-                    if count != 0:
-                        sound["loop"] = True
-                    logger.debug("Set loop count for %s: %d", sound_id, count)
-                    break
+        changes: Dict = {"loops_remaining": count}
+        if count != 0:
+            changes["loop"] = True
+        logger.debug("Set loop count for %s: %d", sound_id, count)
+        self._post_command(self._update_sound, sound_id, changes)
 
     def set_sound_loop_delay(self, sound_id: str, delay: float):
         """Set the delay between loops for a currently playing sound.
@@ -1400,13 +1898,94 @@ class AudioMixer:
             delay: Delay in seconds between loops
         """
         delay = max(0.0, min(10.0, delay))
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    sound["loop_delay"] = delay
-                    sound["loop_delay_samples"] = int(delay * self.sample_rate)
-                    logger.debug("Set loop delay for %s: %.2f", sound_id, delay)
-                    break
+        logger.debug("Set loop delay for %s: %.2f", sound_id, delay)
+        self._post_command(
+            self._update_sound,
+            sound_id,
+            {"loop_delay": delay, "loop_delay_samples": int(delay * self.sample_rate)},
+        )
+
+    # Audio-thread side of the controls above (run via _post_command)
+
+    def _add_sound(self, sound_entry: Dict):
+        if not self._free_voices:
+            self._grow_voices(len(self._voice_flags))
+        v = self._free_voices.pop()
+        meta = dict(sound_entry)
+        data = meta.pop("data")
+        self._voice_seq += 1
+        meta["seq"] = self._voice_seq
+        self._voice_meta[v] = meta
+        self._voice_data[v] = data
+        self._voice_lengths[v] = len(data)
+        self._voice_positions[v] = meta.pop("position", 0)
+        self._voice_gains[v] = meta["volume"] * meta["scale"]
+        self._update_fade(v)
+        paused = meta.pop("paused", False)
+        in_delay = meta.pop("in_delay", False)
+        self._voice_flags[v] = (
+            VOICE_ACTIVE | (VOICE_PAUSED if paused else 0) | (VOICE_IN_DELAY if in_delay else 0)
+        )
+
+    def _update_fade(self, v: int):
+        """Fade out the last frames of a non-looping voice (nothing for loops or short sounds)."""
+        length = int(self._voice_lengths[v])
+        fade = len(self._fade_curve)
+        if self._voice_meta[v]["loop"] or length < fade:
+            self._voice_fade_starts[v] = length
+        else:
+            self._voice_fade_starts[v] = length - fade
+
+    def _release_voice(self, v: int):
+        self._voice_flags[v] = 0
+        self._free_voices.append(v)
+        self._voice_meta[v] = None
+        self._voice_data[v] = self._empty_voice
+
+    def _clear_voices(self):
+        for v in np.flatnonzero(self._voice_flags).tolist():
+            self._release_voice(v)
+
+    def _remove_sound(self, sound_id: str):
+        for v in np.flatnonzero(self._voice_flags).tolist():
+            if self._voice_meta[v].get("sound_id") == sound_id:
+                self._release_voice(v)
+        # Release PTT right away once nothing is left playing
+        if not self._voice_flags.any():
+            self._release_ptt()
+
+    def _update_sound(self, sound_id: str, changes: Dict):
+        v = self._find_voice(sound_id)
+        if v is None:
+            return
+        meta = self._voice_meta[v]
+        for key, value in changes.items():
+            if key == "position":
+                self._voice_positions[v] = value
+            elif key == "data":
+                self._voice_data[v] = value
+                self._voice_lengths[v] = len(value)
+            elif key in ("paused", "in_delay"):
+                bit = VOICE_PAUSED if key == "paused" else VOICE_IN_DELAY
+                flags = int(self._voice_flags[v])
+                self._voice_flags[v] = flags | bit if value else flags & ~bit
+            else:
+                meta[key] = value
+        if "volume" in changes or "scale" in changes:
+            self._voice_gains[v] = meta["volume"] * meta["scale"]
+        if "data" in changes or "loop" in changes:
+            self._update_fade(v)
+
+    def _set_loop(self, sound_id: str, loop: Optional[bool]):
+        v = self._find_voice(sound_id)
+        if v is None:
+            return
+        meta = self._voice_meta[v]
+        meta["loop"] = not meta.get("loop", False) if loop is None else loop
+        # If enabling loop and loops_remaining was 0, set to infinite
+        if meta["loop"] and meta.get("loops_remaining", 0) == 0:
+            meta["loops_remaining"] = -1
+        self._update_fade(v)
 
     def set_sound_speed(self, sound_id: str, speed: float, preserve_pitch: bool = True):
         """Change the playback speed of a currently playing sound.
@@ -1427,46 +2006,37 @@ class AudioMixer:
         file_path = None
         old_pos = 0
         old_total = 0
-        is_looping = False
-
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    file_path = sound.get("file_path")
-                    old_pos = sound.get("position", 0)
-                    old_total = len(sound.get("data", []))
-                    is_looping = sound.get("loop", False)
-                    break
+
+        # Read-only look at the audio thread's voices
+        for v, meta in self._voices_in_order():
+            if meta.get("sound_id") != sound_id:
+                continue
+            file_path = meta.get("file_path")
+            old_pos = int(self._voice_positions[v])
+            old_total = int(self._voice_lengths[v])
+            break
 
         if not file_path or not self.sound_cache:
             return
 
-        original_data = self.sound_cache.get_sound_data(file_path)
-        if original_data is None:
+        # Apply speed (uses librosa time-stretch if preserve_pitch=True and available;
+        # cached per speed, so dragging back to a previous value is instant)
+        processed = self._get_speed_data(file_path, speed, preserve_pitch)
+        if processed is None:
             return
-
-        # Apply speed (uses librosa time-stretch if preserve_pitch=True and available)
-        if speed != 1.0:
-            new_data = self._apply_speed(original_data, speed, preserve_pitch)
-        else:
-            new_data = original_data.copy()
-
-        # Apply fade-out for non-looping sounds
-        if not is_looping:
-            new_data = _apply_fade_out(new_data, self.sample_rate)
+        new_data = processed[0]
 
         # Calculate new position based on progress ratio
         progress_ratio = old_pos / old_total if old_total > 0 else 0.0
         new_pos = int(progress_ratio * len(new_data))
 
         # Update sound data
-        with self.lock:
-            for sound in self.currently_playing:
-                if sound.get("sound_id") == sound_id:
-                    sound["data"] = new_data
-                    sound["position"] = new_pos
-                    sound["speed"] = speed
-                    break
+        new_data, scale = self._to_voice_data(new_data)
+        self._post_command(
+            self._update_sound,
+            sound_id,
+            {"data": new_data, "scale": scale, "position": new_pos, "speed": speed},
+        )
 
     def get_playing_sounds(self) -> List[Dict]:
         """Get a snapshot of currently playing sounds for UI display.
@@ -1486,34 +2056,36 @@ class AudioMixer:
             - elapsed_seconds: Elapsed time in seconds
             - total_seconds: Total duration in seconds
         """
+        # Read-only look at the audio thread's voices. Each column is read with
+        # one fancy-indexing call and converted to Python numbers in bulk
+        voices = self._voices_in_order()
+        slots = [v for v, _ in voices]
+        flags = self._voice_flags[slots].tolist()
+        positions = self._voice_positions[slots].tolist()
+        lengths = self._voice_lengths[slots].tolist()
+        rate = self.sample_rate
+
         result = []
-        with self.lock:
-            for sound in self.currently_playing:
-                data_len = len(sound.get("data", []))
-                pos = sound.get("position", 0)
-                progress = pos / data_len if data_len > 0 else 0.0
-
-                total_seconds = data_len / self.sample_rate if data_len > 0 else 0.0
-                elapsed_seconds = pos / self.sample_rate if data_len > 0 else 0.0
-
-                result.append(
-                    {
-                        "sound_id": sound.get("sound_id"),
-                        "name": sound.get("name", "Unknown"),
-                        "progress": progress,
-                        "volume": sound.get("volume", 1.0),
-                        "loop": sound.get("loop", False),
-                        "loop_count": sound.get("loop_count", 0),
-                        "loops_remaining": sound.get("loops_remaining", 0),
-                        "loop_delay": sound.get("loop_delay", 0.0),
-                        "in_delay": sound.get("in_delay", False),
-                        "paused": sound.get("paused", False),
-                        "speed": sound.get("speed", 1.0),
-                        "file_path": sound.get("file_path"),
-                        "elapsed_seconds": elapsed_seconds,
-                        "total_seconds": total_seconds,
-                    }
-                )
+        for (_, sound), flag, pos, data_len in zip(voices, flags, positions, lengths):
+            has_data = data_len > 0
+            result.append(
+                {
+                    "sound_id": sound["sound_id"],
+                    "name": sound["name"],
+                    "progress": pos / data_len if has_data else 0.0,
+                    "volume": sound["volume"],
+                    "loop": sound["loop"],
+                    "loop_count": sound["loop_count"],
+                    "loops_remaining": sound["loops_remaining"],
+                    "loop_delay": sound["loop_delay"],
+                    "in_delay": bool(flag & VOICE_IN_DELAY),
+                    "paused": bool(flag & VOICE_PAUSED),
+                    "speed": sound["speed"],
+                    "file_path": sound["file_path"],
+                    "elapsed_seconds": pos / rate if has_data else 0.0,
+                    "total_seconds": data_len / rate if has_data else 0.0,
+                }
+            )
         return result
 
     def set_ptt_key(self, key: Optional[str]):
@@ -1607,6 +2179,5 @@ class AudioMixer:
 
     def _check_ptt_release(self):
         """Check if all sounds finished and release PTT if so."""
-        with self.lock:
-            if len(self.currently_playing) == 0 and self.sound_queue.empty():
-                self._release_ptt()
+        if not self._voice_flags.any() and not self._commands and not self._preparing:
+            self._release_ptt()
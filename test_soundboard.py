@@ -5,8 +5,11 @@ Run with: python test_soundboard.py
 """
 
 import unittest
+import importlib.util
 import sys
 import os
+import tempfile
+import threading
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -19,6 +22,11 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 # Import constants directly (doesn't import audio modules)
 from soundboard.constants import COLORS, UI
 
+# Audio engine tests drive the mixer callbacks directly, so no device is opened
+import numpy as np
+import soundfile as sf
+from soundboard import _mix_kernel, audio
+
 
 # Re-define models here to avoid importing the full soundboard package
 # which would trigger sounddevice initialization
@@ -372,6 +380,414 @@ class TestMoveSlotBetweenTabs(unittest.TestCase):
         self.assertEqual(tab2.slots[0].name, "Sound A")
 
 
+class TestVoiceEngine(unittest.TestCase):
+    """Test the mixer's voice slots by calling the output callback directly."""
+
+    SAMPLE_RATE = 48000
+    BLOCK = 256
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.mixer = audio.AudioMixer(0, 1, sample_rate=self.SAMPLE_RATE, block_size=self.BLOCK)
+        self.mixer.mic_muted = True
+
+    def tearDown(self):
+        self.mixer.stop()
+        self.tmp.cleanup()
+
+    def _tone(self, name, frames, amplitude=0.25):
+        """Write a stereo float WAV at the mixer's rate and return (path, samples)."""
+        t = np.arange(frames) / self.SAMPLE_RATE
+        data = np.stack(
+            [amplitude * np.sin(2 * np.pi * 440 * t), amplitude * np.cos(2 * np.pi * 330 * t)],
+            axis=1,
+        ).astype(np.float32)
+        path = os.path.join(self.tmp.name, f"{name}.wav")
+        sf.write(path, data, self.SAMPLE_RATE, subtype="FLOAT")
+        return path, data
+
+    def _mix(self, blocks):
+        """Run the output callback `blocks` times and return the blocks it wrote."""
+        out = np.zeros((self.BLOCK, 2), dtype=np.float32)
+        written = []
+        for _ in range(blocks):
+            self.mixer._output_callback(out, self.BLOCK, None, None)
+            written.append(out.copy())
+        return written
+
+    def _assert_free(self):
+        """Every voice slot is free again."""
+        self.assertEqual(self.mixer.get_playing_sounds(), [])
+        self.assertFalse(self.mixer._voice_flags.any())
+        self.assertEqual(sorted(self.mixer._free_voices), list(range(len(self.mixer._voice_flags))))
+
+    def test_sound_plays_to_completion_and_frees_slot(self):
+        """A sound is mixed sample for sample, then its slot is released."""
+        path, data = self._tone("short", 600)
+        self.mixer.play_sound(path, sound_id="a")
+        self.assertEqual([s["sound_id"] for s in self.mixer.get_playing_sounds()], ["a"])
+
+        out = np.concatenate(self._mix(4))
+        np.testing.assert_allclose(out[:600], data, atol=1e-6)
+        self.assertFalse(out[600:].any())
+        self._assert_free()
+
+    def test_loop_without_delay_replays_then_frees(self):
+        """A loop with loop_count=1 plays twice, then its slot is released."""
+        path, data = self._tone("loop", self.BLOCK)
+        self.mixer.play_sound(path, sound_id="a", loop=True, loop_count=1)
+
+        blocks = self._mix(3)
+        np.testing.assert_allclose(blocks[0], data, atol=1e-6)
+        np.testing.assert_allclose(blocks[2], data, atol=1e-6)
+        self.assertEqual(self.mixer.get_playing_sounds()[0]["loops_remaining"], 0)
+
+        self._mix(2)
+        self._assert_free()
+
+    def test_loop_with_delay_waits_then_replays(self):
+        """An endless loop stays silent for its delay, then starts over."""
+        path, data = self._tone("delay", self.BLOCK)
+        self.mixer.play_sound(path, sound_id="a", loop=True, loop_delay=0.01)  # 480 frames
+
+        blocks = self._mix(2)
+        np.testing.assert_allclose(blocks[0], data, atol=1e-6)
+        self.assertFalse(blocks[1].any())
+        self.assertTrue(self.mixer.get_playing_sounds()[0]["in_delay"])
+
+        blocks = self._mix(3)
+        self.assertFalse(blocks[0].any() or blocks[1].any())
+        np.testing.assert_allclose(blocks[2], data, atol=1e-6)
+        sound = self.mixer.get_playing_sounds()[0]
+        self.assertFalse(sound["in_delay"])
+        self.assertEqual(sound["loops_remaining"], -1)
+
+    def test_pause_and_resume(self):
+        """A paused sound is silent and keeps its position until resumed."""
+        path, data = self._tone("pause", 4 * self.BLOCK)
+        self.mixer.play_sound(path, sound_id="a")
+        self._mix(1)
+
+        self.mixer.pause_sound("a")
+        blocks = self._mix(2)
+        self.assertFalse(blocks[0].any() or blocks[1].any())
+        sound = self.mixer.get_playing_sounds()[0]
+        self.assertTrue(sound["paused"])
+        self.assertEqual(sound["progress"], 0.25)
+
+        self.mixer.resume_sound("a")
+        blocks = self._mix(1)
+        np.testing.assert_allclose(blocks[0], data[self.BLOCK : 2 * self.BLOCK], atol=1e-6)
+
+    def test_voices_grow_past_initial_slots(self):
+        """More sounds than the 16 initial slots are all mixed, then all freed."""
+        path, data = self._tone("many", 4 * self.BLOCK, amplitude=0.01)
+        for i in range(20):
+            self.mixer.play_sound(path, sound_id=str(i))
+        self.assertGreaterEqual(len(self.mixer._voice_flags), 20)
+        self.assertEqual(
+            [s["sound_id"] for s in self.mixer.get_playing_sounds()], [str(i) for i in range(20)]
+        )
+
+        blocks = self._mix(1)
+        np.testing.assert_allclose(blocks[0], 20 * data[: self.BLOCK], atol=1e-5)
+
+        self.mixer.stop_all_sounds()
+        self._mix(1)
+        self._assert_free()
+
+
+def _load_numpy_kernels():
+    """Load a second copy of _mix_kernel with Numba hidden, i.e. its numpy fallback."""
+    spec = importlib.util.spec_from_file_location("_mix_kernel_numpy", _mix_kernel.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with patch.dict(sys.modules, {"numba": None, "numba.typed": None}):
+        spec.loader.exec_module(module)
+    return module
+
+
+@unittest.skipUnless(_mix_kernel.NUMBA_AVAILABLE, "Numba not installed")
+class TestMixKernelFallback(unittest.TestCase):
+    """Test that the Numba kernels and their numpy fallbacks agree."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fallback = _load_numpy_kernels()
+
+    def setUp(self):
+        self.rng = np.random.default_rng(1234)
+
+    def _run_mix_voices(self, kernels, voices, dtype, flags, positions, fade_starts):
+        frames = 256
+        datas = kernels.new_voice_list(len(voices), 2, dtype, readonly=True)
+        for v, data in enumerate(voices):
+            datas[v] = data
+        out = np.zeros((frames, 2), dtype=np.float32)
+        positions = positions.copy()
+        flags = flags.copy()
+        lengths = np.array([len(d) for d in voices], dtype=np.int64)
+        fade = np.linspace(1.0, 0.0, 300).astype(np.float32)
+        fade.setflags(write=False)
+        gains = np.full(len(voices), 0.7, dtype=np.float32)
+        if dtype == np.int16:
+            gains *= np.float32(_mix_kernel.INT16_SCALE)
+        scratch = np.zeros_like(out)
+        kernels.mix_voices(out, datas, positions, lengths, fade_starts, fade, gains, flags, scratch)
+        return out, positions, flags
+
+    def test_mix_voices_matches(self):
+        """Both mix_voices() versions mix, fade, skip and advance voices the same way."""
+        for dtype in (np.float32, np.int16):
+            voices = []
+            for length in (1000, 300, 200, 1000, 50, 1000):
+                data = self.rng.uniform(-0.5, 0.5, (length, 2))
+                if dtype == np.int16:
+                    data = data * 32767
+                data = np.ascontiguousarray(data, dtype=dtype)
+                data.setflags(write=False)
+                voices.append(data)
+            flags = np.array(
+                [
+                    _mix_kernel.VOICE_ACTIVE,
+                    _mix_kernel.VOICE_ACTIVE,
+                    _mix_kernel.VOICE_ACTIVE | _mix_kernel.VOICE_PAUSED,
+                    _mix_kernel.VOICE_ACTIVE | _mix_kernel.VOICE_HOLD,
+                    _mix_kernel.VOICE_ACTIVE,
+                    0,
+                ],
+                dtype=np.uint8,
+            )
+            positions = np.array([0, 100, 0, 0, 50, 0], dtype=np.int64)
+            # Voice 0 starts fading inside this block, voice 1 is fading throughout
+            fade_starts = np.array([100, 0, 200, 1000, 50, 1000], dtype=np.int64)
+
+            numba_result = self._run_mix_voices(
+                _mix_kernel, voices, dtype, flags, positions, fade_starts
+            )
+            numpy_result = self._run_mix_voices(
+                self.fallback, voices, dtype, flags, positions, fade_starts
+            )
+            np.testing.assert_allclose(numba_result[0], numpy_result[0], atol=1e-6)
+            np.testing.assert_array_equal(numba_result[1], numpy_result[1])
+            np.testing.assert_array_equal(numba_result[2], numpy_result[2])
+            np.testing.assert_array_equal(numba_result[1], [256, 300, 0, 0, 50, 0])
+
+    def test_soft_clip_matches(self):
+        """Both soft_clip() versions limit loud blocks alike, in place or not."""
+        src = (self.rng.standard_normal((1024, 2)) * 3).astype(np.float32)
+        results = []
+        for kernels in (_mix_kernel, self.fallback):
+            out = np.empty_like(src)
+            kernels.soft_clip(src, out, np.empty_like(src))
+            in_place = src.copy()
+            kernels.soft_clip(in_place, in_place, np.empty_like(src))
+            np.testing.assert_array_equal(out, in_place)
+            results.append(out)
+        np.testing.assert_allclose(results[0], results[1], atol=1e-6)
+        self.assertLessEqual(np.abs(results[0]).max(), 1.4)
+        quiet = src[np.abs(src) <= 1.0]
+        np.testing.assert_array_equal(results[0][np.abs(src) <= 1.0], quiet)
+
+    def test_add_mic_matches(self):
+        """Both add_mic() versions broadcast the mono mic over the sounds."""
+        sounds = self.rng.uniform(-1, 1, (256, 2)).astype(np.float32)
+        mic = self.rng.uniform(-1, 1, 256).astype(np.float32)
+        results = []
+        for kernels in (_mix_kernel, self.fallback):
+            out = np.empty_like(sounds)
+            kernels.add_mic(out, sounds, mic, np.float32(0.8))
+            results.append(out)
+        np.testing.assert_allclose(results[0], results[1], atol=1e-6)
+        np.testing.assert_allclose(results[0], sounds + 0.8 * mic[:, None], atol=1e-6)
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Test the single-producer/single-consumer block ring."""
+
+    @staticmethod
+    def _block(value, frames=4):
+        return np.full((frames, 1), value, dtype=np.float32)
+
+    def test_wraparound(self):
+        """Blocks come back in order while the write index wraps many times."""
+        ring = audio.RingBuffer(3, 4, 1)
+        out = np.zeros((4, 1), dtype=np.float32)
+        for i in range(10):
+            ring.write(self._block(i))
+            self.assertEqual(ring.pending(), 1)
+            self.assertEqual(ring.read_into(out), 4)
+            self.assertTrue((out == i).all())
+        self.assertEqual(ring.read_into(out), 0)
+
+    def test_consumer_a_lap_behind_skips_to_newest(self):
+        """An overrun drops the oldest blocks instead of building up latency."""
+        ring = audio.RingBuffer(3, 4, 1)
+        out = np.zeros((4, 1), dtype=np.float32)
+        for i in range(5):
+            ring.write(self._block(i))
+        self.assertEqual(ring.pending(), 3)
+
+        # Resumes at the oldest block the producer will not overwrite next
+        read = []
+        while ring.read_into(out):
+            read.append(float(out[0, 0]))
+        self.assertEqual(read, [3.0, 4.0])
+        self.assertEqual(ring.pending(), 0)
+
+    def test_short_block_and_clear(self):
+        """Short blocks keep their length, and clear() discards unread blocks."""
+        ring = audio.RingBuffer(3, 4, 1)
+        out = np.zeros((4, 1), dtype=np.float32)
+        ring.write(self._block(1, frames=2))
+        self.assertEqual(ring.read_into(out), 2)
+
+        ring.write(self._block(2))
+        ring.write(self._block(3))
+        ring.clear()
+        self.assertEqual(ring.pending(), 0)
+        self.assertEqual(ring.read_into(out), 0)
+
+    def test_int16_storage(self):
+        """An int16 ring casts float blocks on write and returns PCM as stored."""
+        ring = audio.RingBuffer(3, 3, 2, dtype=np.int16)
+        pcm = np.array([[32767, -32768], [1000, -1000], [0, 1]], dtype=np.int16)
+        ring.write(pcm.astype(np.float32))
+        ring.write(pcm[::-1])
+
+        out = np.zeros((3, 2), dtype=np.int16)
+        self.assertEqual(ring.read_into(out), 3)
+        np.testing.assert_array_equal(out, pcm)
+        self.assertEqual(ring.read_into(out), 3)
+        np.testing.assert_array_equal(out, pcm[::-1])
+
+
+class TestDetectFormat(unittest.TestCase):
+    """Test magic-byte decoder routing."""
+
+    HEADERS = [
+        ("wav", b"RIFF\x24\x00\x00\x00WAVE", "soundfile"),
+        ("flac", b"fLaC\x00\x00\x00\x22\x10\x00\x10\x00", "soundfile"),
+        ("aiff", b"FORM\x00\x00\x00\x2eAIFF", "soundfile"),
+        ("aifc", b"FORM\x00\x00\x00\x2eAIFC", "soundfile"),
+        ("ogg", b"OggS\x00\x02\x00\x00\x00\x00\x00\x00", "soundfile"),
+        ("mp3 with ID3", b"ID3\x04\x00\x00\x00\x00\x00\x00\x00\x00", "soundfile"),
+        ("mpeg-1 layer 3 sync", b"\xff\xfb\x90\x64" + bytes(8), "soundfile"),
+        ("mpeg-2 layer 3 sync", b"\xff\xf3\x90\x64" + bytes(8), "soundfile"),
+        ("mp4", b"\x00\x00\x00\x20ftypM4A ", "pydub"),
+        ("asf", b"\x30\x26\xb2\x75\x8e\x66\xcf\x11\xa6\xd9\x00\xaa", "pydub"),
+        ("ebml", b"\x1a\x45\xdf\xa3\x01\x00\x00\x00\x00\x00\x00\x1f", "pydub"),
+        ("adts", b"\xff\xf1\x50\x80\x02\x1f\xfc" + bytes(5), "pydub"),
+        ("unknown", b"\x00" * 12, None),
+        ("RIFF but not WAVE", b"RIFF\x24\x00\x00\x00AVI ", None),
+        ("empty", b"", None),
+    ]
+
+    def test_headers(self):
+        """Each known header picks its decoder; anything else is unrecognized."""
+        for name, head, expected in self.HEADERS:
+            with self.subTest(name):
+                self.assertEqual(audio._detect_format(head), expected)
+
+    def test_extension_fallback(self):
+        """Unrecognized headers are routed by extension; known headers ignore it."""
+        unknown = b"\x00" * 12
+        for ext, expected in [
+            (".m4a", "pydub"),
+            (".wma", "pydub"),
+            (".webm", "pydub"),
+            (".wav", "soundfile"),
+            (".mp3", "soundfile"),
+            ("", "soundfile"),
+        ]:
+            with self.subTest(ext):
+                self.assertEqual(audio._choose_decoder(unknown, ext), expected)
+        # A mis-named WAV still goes to soundfile
+        self.assertEqual(audio._choose_decoder(b"RIFF\x24\x00\x00\x00WAVE", ".m4a"), "soundfile")
+
+
+class TestPcmToFloat(unittest.TestCase):
+    """Test raw PCM conversion used by the pydub fallback."""
+
+    def _check(self, values, sample_width):
+        raw = b"".join(
+            (v & (1 << 8 * sample_width) - 1).to_bytes(sample_width, "little") for v in values
+        )
+        result = audio._pcm_to_float(raw, sample_width)
+        self.assertEqual(result.dtype, np.float32)
+        expected = np.array(values, dtype=np.float64) / 2.0 ** (8 * sample_width - 1)
+        np.testing.assert_allclose(result, expected, rtol=1e-7, atol=0)
+
+    def test_int8(self):
+        """8-bit signed samples scale by 1/128."""
+        self._check([-128, -1, 0, 1, 64, 127], 1)
+
+    def test_int16(self):
+        """16-bit samples scale by 1/32768."""
+        self._check([-32768, -1, 0, 1, 16384, 32767], 2)
+
+    def test_int24(self):
+        """24-bit samples are widened with their sign, including negative values."""
+        self._check([-8388608, -4194304, -2, -1, 0, 1, 4194304, 8388607], 3)
+
+    def test_int32(self):
+        """32-bit samples scale by 1/2**31."""
+        self._check([-(2**31), -65536, -1, 0, 1, 2**30, 2**31 - 1], 4)
+
+
+def _load_legacy_script():
+    """Import the standalone soundboard.py script (its name clashes with the package)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "soundboard.py")
+    spec = importlib.util.spec_from_file_location("legacy_soundboard", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestLegacyStopAll(unittest.TestCase):
+    """Test that Stop All in the standalone script retires sounds still loading."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.legacy = _load_legacy_script()
+
+    def test_stop_during_publish_retires_voice(self):
+        """A loader publishing across stop_all_sounds() does not leave its sound playing."""
+        mixer = self.legacy.AudioMixer(0, 1, block_size=64)
+        data = np.full((1000, 2), 1000, dtype=np.int16)
+        mixer.sound_cache = Mock()
+        mixer.sound_cache.get_or_load.return_value = data
+
+        # Hold the loader inside its epoch check, just before it claims a slot
+        in_publish = threading.Event()
+        resume = threading.Event()
+        claim_voice = mixer._claim_voice
+
+        def paused_claim():
+            in_publish.set()
+            resume.wait(5)
+            return claim_voice()
+
+        mixer._claim_voice = paused_claim
+        loader = threading.Thread(target=mixer._load_and_enqueue, args=("x.wav", 1.0, 0))
+        loader.start()
+        self.assertTrue(in_publish.wait(5))
+
+        stopper = threading.Thread(target=mixer.stop_all_sounds)
+        stopper.start()
+        mic = np.zeros((64, 1), dtype=np.float32)
+        out = np.zeros((64, 2), dtype=np.float32)
+        # A block mixed while the stop is pending, then the loader publishes
+        mixer._audio_callback(mic, out, 64, None, None)
+        resume.set()
+        loader.join(5)
+        stopper.join(5)
+
+        mixer._audio_callback(mic, out, 64, None, None)
+        self.assertFalse(mixer._voice_active.any())
+        self.assertFalse(out.any())
+        mixer.stop()
+
+
 if __name__ == "__main__":
     # Run tests
     print("=" * 60)
@@ -392,6 +808,12 @@ if __name__ == "__main__":
     suite.addTests(loader.loadTestsFromTestCase(TestDragAndDropState))
     suite.addTests(loader.loadTestsFromTestCase(TestSlotSwapping))
     suite.addTests(loader.loadTestsFromTestCase(TestMoveSlotBetweenTabs))
+    suite.addTests(loader.loadTestsFromTestCase(TestVoiceEngine))
+    suite.addTests(loader.loadTestsFromTestCase(TestMixKernelFallback))
+    suite.addTests(loader.loadTestsFromTestCase(TestRingBuffer))
+    suite.addTests(loader.loadTestsFromTestCase(TestDetectFormat))
+    suite.addTests(loader.loadTestsFromTestCase(TestPcmToFloat))
+    suite.addTests(loader.loadTestsFromTestCase(TestLegacyStopAll))
 
     # Run with verbosity
     runner = unittest.TextTestRunner(verbosity=2)